@@ -1,57 +1,127 @@
 #!/usr/bin/env python3
 """Analyze search index content in detail."""
 import json
+import os
+import pickle
+import struct
+import sys
 
 try:
-    with open('site/search/search_index.json', 'r') as f:
-        data = json.load(f)
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
-    print("=" * 60)
-    print("SEARCH INDEX ANALYSIS")
-    print("=" * 60)
+SEARCH_INDEX_PATH = 'site/search/search_index.json'
+# Parsed index cache, prefixed with the source mtime; kept out of the built site
+SEARCH_INDEX_CACHE_PATH = '.cache/search_index.pkl'
+# Separator configured in mkdocs.yml for the search plugin
+EXPECTED_SEPARATOR = r'[\s\-\.]+'
+BANNER = "=" * 60
+SECTION_BREAK = "\n" + BANNER
 
-    print(f"\n📊 Total Documents Indexed: {len(data['docs'])}")
-    print(f"\n⚙️  Search Configuration:")
-    print(f"   - Language: {data['config'].get('lang', 'N/A')}")
-    print(f"   - Separator: {data['config'].get('separator', 'N/A')}")
-    print(f"   - Pipeline: {data['config'].get('pipeline', 'N/A')}")
-    print(f"   - Fields: {list(data['config'].get('fields', {}).keys())}")
 
-    print(f"\n📄 Indexed Documents:")
-    for i, doc in enumerate(data['docs'], 1):
-        print(f"\n   {i}. {doc.get('title', 'Untitled')}")
-        print(f"      Location: {doc.get('location', 'Unknown')}")
-        text_preview = doc.get('text', '')[:100]
-        print(f"      Text preview: {text_preview}...")
+def load_search_index():
+    """Load the search index, reusing the pickle sidecar while it is fresh."""
+    stamp = struct.pack('<q', os.stat(SEARCH_INDEX_PATH).st_mtime_ns)
 
-    print("\n" + "=" * 60)
-    print("VERIFICATION RESULTS")
-    print("=" * 60)
+    try:
+        with open(SEARCH_INDEX_CACHE_PATH, 'rb') as f:
+            if f.read(len(stamp)) == stamp:
+                return pickle.load(f)
+    except Exception:
+        # Any unreadable or stale-format cache falls back to reparsing the JSON
+        pass
 
-    # Verification checks
-    docs_count = len(data['docs'])
-    config = data['config']
+    if orjson is not None:
+        with open(SEARCH_INDEX_PATH, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(SEARCH_INDEX_PATH, 'r') as f:
+            data = json.load(f)
+
+    # Write to a temp file and rename so a partial cache is never read
+    tmp_path = SEARCH_INDEX_CACHE_PATH + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(SEARCH_INDEX_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(stamp)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, SEARCH_INDEX_CACHE_PATH)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return data
+
+
+def verify_search_index(docs_count, config):
+    """Run the index checks and return the report lines.
+
+    Kept free of I/O so the same checks can be run over many indexes.
+    """
+    lines = []
 
     # Check 1: Document count
     if docs_count > 5:
-        print("\n✅ PASS: More than 5 documents indexed")
+        lines.append("\n✅ PASS: More than 5 documents indexed")
     else:
-        print(f"\n❌ FAIL: Only {docs_count} documents indexed (expected >5)")
-        print("   This indicates the search index is incomplete or outdated.")
+        lines.append(f"\n❌ FAIL: Only {docs_count} documents indexed (expected >5)")
+        lines.append("   This indicates the search index is incomplete or outdated.")
 
     # Check 2: Configuration
-    expected_separator = r'[\s\-\.]+'
     actual_separator = config.get('separator', '')
 
-    if actual_separator == expected_separator:
-        print("✅ PASS: Search configuration is up to date")
+    if actual_separator == EXPECTED_SEPARATOR:
+        lines.append("✅ PASS: Search configuration is up to date")
     else:
-        print(f"⚠️  WARNING: Search configuration appears outdated")
-        print(f"   Expected: {expected_separator}")
-        print(f"   Actual: {actual_separator}")
-        print("   The site may need to be rebuilt with: mkdocs build")
+        lines.append("⚠️  WARNING: Search configuration appears outdated")
+        lines.append(f"   Expected: {EXPECTED_SEPARATOR}")
+        lines.append(f"   Actual: {actual_separator}")
+        lines.append("   The site may need to be rebuilt with: mkdocs build")
+
+    return lines
+
+
+try:
+    data = load_search_index()
+
+    # Only the docs list and the config block are used below; look them up once
+    docs = data['docs']
+    config = data['config']
+    docs_count = len(docs)
+
+    print(BANNER)
+    print("SEARCH INDEX ANALYSIS")
+    print(BANNER)
+
+    print(f"\n📊 Total Documents Indexed: {docs_count}")
+    print(f"\n⚙️  Search Configuration:")
+    print(f"   - Language: {config.get('lang', 'N/A')}")
+    print(f"   - Separator: {config.get('separator', 'N/A')}")
+    print(f"   - Pipeline: {config.get('pipeline', 'N/A')}")
+    print(f"   - Fields: {list(config.get('fields', {}).keys())}")
+
+    print(f"\n📄 Indexed Documents:")
+    # Build the listing in memory and emit it with a single write
+    lines = []
+    for i, doc in enumerate(docs, 1):
+        lines.append(f"\n   {i}. {doc.get('title', 'Untitled')}")
+        lines.append(f"      Location: {doc.get('location', 'Unknown')}")
+        text_preview = doc.get('text', '')[:100]
+        lines.append(f"      Text preview: {text_preview}...")
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+    print(SECTION_BREAK)
+    print("VERIFICATION RESULTS")
+    print(BANNER)
+
+    # Verification checks
+    sys.stdout.write('\n'.join(verify_search_index(docs_count, config)) + '\n')
 
-    print("\n" + "=" * 60)
+    print(SECTION_BREAK)
 
 except FileNotFoundError:
     print('❌ ERROR: search_index.json not found at site/search/search_index.json')
@@ -11,30 +11,105 @@ three-tier approach:
 Output is structured data suitable for MkDocs documentation generation.
 """
 
+from __future__ import annotations
+
 import argparse
 import ast
+import base64
+import functools
+import hashlib
+import json
 import logging
 import os
 import re
 import sys
+import threading
 import time
-import urllib.request
-import urllib.error
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+# Third-party packages (PyGithub alone pulls in requests/urllib3/nacl) are
+# imported inside the functions that use them, so importing this module or
+# running --help does not pay for them
+if TYPE_CHECKING:
+    import markdown2
+    import requests
+    from github import Github
+    from github.GithubException import RateLimitExceededException
+    from urllib3.util.retry import Retry
+
+
+logger = logging.getLogger(__name__)
+
+# Matches GitHub repository URLs and captures (owner, repo)
+_GITHUB_URL_RE = re.compile(r'github\.com[/:]?([^/]+)/([^/]+?)(?:\.git)?/?$')
+
+# Matches a single README line that is either a category header
+# ("## Name") or a project entry ("- [Title](URL) - Description").
+# Surrounding whitespace is allowed so lines need not be stripped first.
+_README_LINE_RE = re.compile(
+    r"\s*(?:"
+    r"##\s+(?P<category>\S.*)"
+    r"|-\s+\[(?P<title>[^\]]+)\]\((?P<url>[^)]+)\)\s*(?:-\s*(?P<description>\S.*))?"
+    r")$"
+)
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+_GITHUB_HTTPS_PREFIX = "https://github.com/"
+
+# README file names tried, in order, on raw.githubusercontent.com
+README_FILENAMES = ('README.md', 'README.markdown', 'README.rst', 'README')
+
+# Branches probed, in order, for each README filename on raw.githubusercontent.com
+RAW_README_BRANCHES = ('main', 'master')
+
+# Upper bound on README bytes kept from the API or a raw download; larger files are truncated
+MAX_README_BYTES = 512 * 1024
 
-import frontmatter
-import markdown2
-from github import Github
-from github.GithubException import RateLimitExceededException
+# Tier 3 entry-point files larger than this are skipped rather than parsed
+MAX_PYTHON_FILE_BYTES = 512 * 1024
 
+# Unix time until which the GitHub REST API quota is known to be used up;
+# API calls are skipped until then so callers go straight to their fallbacks
+_api_quota_reset_at = 0.0
 
-@dataclass
+# How long a README stored in the on-disk cache is reused without refetching
+README_CACHE_TTL = 24 * 60 * 60
+
+# Words PyYAML would resolve to booleans or null if written unquoted
+_YAML_RESERVED_WORDS = frozenset({'yes', 'no', 'true', 'false', 'on', 'off', 'null'})
+
+# Column at which PyYAML starts folding long plain scalars
+_YAML_LINE_WIDTH = 80
+
+# markdown2.Markdown instances per thread, keyed by their extras
+_markdown_converters = threading.local()
+
+# requests.Session per thread so raw README fetches reuse keep-alive connections
+_http_sessions = threading.local()
+
+# Shared pool for fetching Tier 3 candidate files in parallel; its threads keep
+# their own sessions, so connections stay warm across projects
+_python_file_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="tier3")
+
+# README fetches in progress, keyed by repository URL, so a project listed in
+# several categories is fetched once even when its entries run concurrently
+_inflight_readmes: Dict[str, Future] = {}
+_inflight_readmes_lock = threading.Lock()
+
+
+@dataclass(slots=True)
 class Project:
     """
     Represents a single project entry from the awesome-llm-apps repository.
 
+    Declared with __slots__ since one instance is kept per catalog entry for
+    the whole run.
+
     Attributes:
         title: The project name/title
         url: The GitHub repository URL
@@ -66,7 +141,6 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
             logging.StreamHandler(sys.stdout)
         ]
     )
-    logger = logging.getLogger(__name__)
     logger.info(f"Logging initialized at {log_level.upper()} level")
     logger.debug("Detailed debug logging enabled")
     return logger
@@ -79,7 +153,6 @@ def parse_arguments() -> argparse.Namespace:
     Returns:
         Parsed arguments namespace
     """
-    logger = logging.getLogger(__name__)
     logger.debug("Parsing command-line arguments")
 
     parser = argparse.ArgumentParser(
@@ -96,11 +169,17 @@ Examples:
   # Run without caching
   %(prog)s --skip-cache
 
+  # Keep the HTTP cache in a custom directory
+  %(prog)s --cache-dir /tmp/llm-apps-cache
+
   # Dry run to test without writing files
   %(prog)s --dry-run
 
   # Enable debug logging
   %(prog)s --debug
+
+  # Fetch up to 16 projects concurrently
+  %(prog)s --workers 16
         """
     )
 
@@ -117,10 +196,17 @@ Examples:
         help="Skip using cached data and refetch all READMEs"
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=".cache",
+        help="Directory for cached README responses (default: .cache)"
+    )
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Parse and process but don't write output files"
+        help="Parse and process but don't write output files or cache entries"
     )
 
     parser.add_argument(
@@ -136,12 +222,43 @@ Examples:
         help="GitHub Personal Access Token (default: from GITHUB_TOKEN env var)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of projects to fetch and process concurrently (default: 8)"
+    )
+
     args = parser.parse_args()
-    logger.debug(f"Arguments parsed: output_dir={args.output_dir}, skip_cache={args.skip_cache}, dry_run={args.dry_run}, debug={args.debug}")
+    logger.debug(
+        "Arguments parsed: output_dir=%s, skip_cache=%s, cache_dir=%s, dry_run=%s, debug=%s, workers=%s",
+        args.output_dir, args.skip_cache, args.cache_dir, args.dry_run, args.debug, args.workers
+    )
     return args
 
 
-def get_github_client(token: str) -> Github:
+def _transient_error_retry() -> Retry:
+    """
+    Return the urllib3 retry policy shared by the HTTP session and GitHub client.
+
+    Only transient gateway errors are retried. Connection failures and
+    timeouts fail fast, and rate-limit responses (403/429) are not retried
+    here: they surface as errors so fetch_with_retry can stop using the API
+    once the quota is gone instead of sleeping until the reset.
+    """
+    from urllib3.util.retry import Retry
+
+    return Retry(
+        total=3,
+        connect=0,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        respect_retry_after_header=False,
+    )
+
+
+def get_github_client(token: str, pool_size: Optional[int] = None) -> Github:
     """
     Create and configure a GitHub API client with authentication.
 
@@ -153,6 +270,8 @@ def get_github_client(token: str) -> Github:
         token: GitHub Personal Access Token for authentication. If empty,
                the client will work without authentication but with lower
                rate limits.
+        pool_size: Number of pooled keep-alive connections to api.github.com.
+                   Should be at least the number of threads sharing the client.
 
     Returns:
         Initialized Github client instance
@@ -160,18 +279,22 @@ def get_github_client(token: str) -> Github:
     Note:
         If the provided token is invalid, the function will fall back to
         unauthenticated access with a warning message.
+
+        PyGithub's default retry sleeps through rate limits (until
+        X-RateLimit-Reset for an exhausted quota), which would stall every
+        worker; the client uses _transient_error_retry() instead.
     """
-    logger = logging.getLogger(__name__)
+    from github import Github
 
     if token:
         logger.debug("Creating GitHub client with authentication")
         try:
-            client = Github(token)
+            client = Github(token, pool_size=pool_size, retry=_transient_error_retry())
             # Test the connection by checking rate limit
             rate_limit = client.get_rate_limit()
             logger.debug(
-                f"GitHub API rate limit: {rate_limit.core.remaining} "
-                f"of {rate_limit.core.limit} remaining"
+                "GitHub API rate limit: %s of %s remaining",
+                rate_limit.core.remaining, rate_limit.core.limit
             )
             logger.info("GitHub client authenticated successfully")
             return client
@@ -181,7 +304,7 @@ def get_github_client(token: str) -> Github:
                 "Falling back to unauthenticated access."
             )
             # Fall back to unauthenticated client
-            client = Github()
+            client = Github(pool_size=pool_size, retry=_transient_error_retry())
             return client
     else:
         logger.warning(
@@ -189,10 +312,35 @@ def get_github_client(token: str) -> Github:
             "rate limited to 60 requests/hour. "
             "Set GITHUB_TOKEN environment variable for increased limits."
         )
-        client = Github()
+        client = Github(pool_size=pool_size, retry=_transient_error_retry())
         return client
 
 
+def _quota_reset_time(error: RateLimitExceededException) -> Optional[float]:
+    """
+    Return when the primary API quota resets, if the error reports it used up.
+
+    Secondary (abuse) rate limits do not set X-RateLimit-Remaining to 0 and
+    return None, so they are still retried with backoff.
+    """
+    headers = {key.lower(): value for key, value in (error.headers or {}).items()}
+    if headers.get('x-ratelimit-remaining') != '0':
+        return None
+    try:
+        return float(headers['x-ratelimit-reset'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _retry_after_seconds(error: RateLimitExceededException) -> Optional[float]:
+    """Return the Retry-After delay sent with a secondary rate limit, if any."""
+    headers = {key.lower(): value for key, value in (error.headers or {}).items()}
+    try:
+        return max(0.0, float(headers['retry-after']))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 def fetch_with_retry(
     github_client: Github,
     fetch_operation: Callable,
@@ -207,6 +355,12 @@ def fetch_with_retry(
     gracefully. When a rate limit is hit, it waits exponentially longer between
     retries (1s, 2s, 4s, etc.) to allow the rate limit to reset.
 
+    If the response shows the hourly quota is used up, waiting a few seconds
+    cannot help: the reset time is recorded and this and every later call
+    return None immediately until then, so callers fall back to raw URLs
+    without spending retries. Secondary rate limits that send Retry-After
+    wait exactly that long instead of the exponential backoff.
+
     Args:
         github_client: Authenticated Github client instance
         fetch_operation: Callable that performs the GitHub API operation.
@@ -217,6 +371,7 @@ def fetch_with_retry(
 
     Returns:
         Result of the fetch_operation if successful, None if all retries exhausted
+        or the API quota is used up
 
     Example:
         >>> client = get_github_client(token)
@@ -225,17 +380,34 @@ def fetch_with_retry(
         ...     return repo_obj.get_readme().decoded_content.decode('utf-8')
         >>> content = fetch_with_retry(client, get_readme, 'owner/repo')
     """
-    logger = logging.getLogger(__name__)
+    from github.GithubException import RateLimitExceededException
+
+    global _api_quota_reset_at
+
+    if time.time() < _api_quota_reset_at:
+        logger.debug("GitHub API quota used up, skipping API request for %s", repo_name)
+        return None
 
     for attempt in range(max_retries):
         try:
-            logger.debug(f"Fetching {repo_name} (attempt {attempt + 1}/{max_retries})")
+            logger.debug("Fetching %s (attempt %s/%s)", repo_name, attempt + 1, max_retries)
             result = fetch_operation(repo_name)
-            logger.debug(f"Successfully fetched {repo_name}")
+            logger.debug("Successfully fetched %s", repo_name)
             return result
 
         except RateLimitExceededException as e:
-            wait_time = initial_wait * (2 ** attempt)
+            reset_at = _quota_reset_time(e)
+            if reset_at:
+                _api_quota_reset_at = reset_at
+                logger.warning(
+                    f"GitHub API quota used up while fetching {repo_name}; "
+                    f"skipping API requests until {time.strftime('%H:%M:%S', time.localtime(reset_at))}"
+                )
+                return None
+
+            wait_time = _retry_after_seconds(e)
+            if wait_time is None:
+                wait_time = initial_wait * (2 ** attempt)
 
             if attempt < max_retries - 1:
                 logger.warning(
@@ -258,18 +430,256 @@ def fetch_with_retry(
     return None
 
 
-def fetch_raw_readme(repo_url: str, branch: str = "main", timeout: int = 10) -> Optional[str]:
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """Write JSON to path via a temp file so readers never see a partial file."""
+    # Unique temp name per process and thread so concurrent writers never share a file
+    temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path.write_text(json.dumps(data), encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def _http_cache_path(cache_dir: str, url: str) -> Path:
+    """Return the cache file path used for a URL's conditional GET entry."""
+    digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return Path(cache_dir) / "http" / f"{digest}.json"
+
+
+def load_http_cache_entry(cache_dir: str, url: str) -> Optional[Dict[str, str]]:
+    """
+    Load the cached response for a URL.
+
+    Args:
+        cache_dir: Base cache directory
+        url: URL the response was fetched from
+
+    Returns:
+        Dictionary with 'etag', 'last_modified' and 'body' keys, or None if
+        the URL has no usable cache entry
+    """
+    try:
+        entry = json.loads(_http_cache_path(cache_dir, url).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or 'body' not in entry:
+        return None
+    return entry
+
+
+def save_http_cache_entry(
+    cache_dir: str,
+    url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    body: str
+) -> None:
+    """
+    Store a response so later runs can revalidate it with a conditional GET.
+
+    Responses without an ETag or Last-Modified header cannot be revalidated
+    and are not stored. Write failures are logged and otherwise ignored.
+
+    Args:
+        cache_dir: Base cache directory
+        url: URL the response was fetched from
+        etag: Value of the response ETag header
+        last_modified: Value of the response Last-Modified header
+        body: Decoded response body
+    """
+    if not etag and not last_modified:
+        return
+
+    entry = {'url': url, 'etag': etag, 'last_modified': last_modified, 'body': body}
+
+    try:
+        _write_json_atomic(_http_cache_path(cache_dir, url), entry)
+    except OSError as e:
+        logger.warning(f"Failed to write HTTP cache entry for {url}: {e}")
+
+
+def _readme_cache_path(cache_dir: str, repo_url: str) -> Path:
+    """Return the cache file path used for a repository's README."""
+    digest = hashlib.sha1(repo_url.encode('utf-8')).hexdigest()
+    return Path(cache_dir) / "readmes" / f"{digest}.json"
+
+
+def load_cached_readme(
+    cache_dir: str,
+    repo_url: str,
+    max_age: float = README_CACHE_TTL
+) -> Optional[str]:
+    """
+    Load a README fetched by a previous run if it is recent enough.
+
+    Args:
+        cache_dir: Base cache directory
+        repo_url: GitHub repository URL the README belongs to
+        max_age: Maximum age of the cached README in seconds (default: 24 hours)
+
+    Returns:
+        README content, or None if it is not cached or has expired
+    """
+    try:
+        entry = json.loads(_readme_cache_path(cache_dir, repo_url).read_text(encoding='utf-8'))
+        if time.time() - entry['fetched_at'] > max_age:
+            return None
+        return entry['content']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_cached_readme(cache_dir: str, repo_url: str, content: str) -> None:
+    """
+    Store a fetched README so later runs can skip fetching it.
+
+    Args:
+        cache_dir: Base cache directory
+        repo_url: GitHub repository URL the README belongs to
+        content: README content
+    """
+    entry = {'url': repo_url, 'fetched_at': time.time(), 'content': content}
+
+    try:
+        _write_json_atomic(_readme_cache_path(cache_dir, repo_url), entry)
+    except OSError as e:
+        logger.warning(f"Failed to write README cache entry for {repo_url}: {e}")
+
+
+def _get_http_session() -> requests.Session:
+    """Return the calling thread's HTTP session, creating it on first use."""
+    session = getattr(_http_sessions, 'session', None)
+    if session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers['User-Agent'] = 'Mozilla/5.0'
+        session.mount('https://', HTTPAdapter(max_retries=_transient_error_retry()))
+        _http_sessions.session = session
+    return session
+
+
+def _read_limited(response: requests.Response, limit: int) -> Tuple[bytes, bool]:
+    """
+    Read a streamed response body, stopping once it exceeds ``limit`` bytes.
+
+    The body is read in chunks so an oversized file is never held in memory
+    in full. Returns the first ``limit`` bytes and whether the body was longer.
+    """
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=65536):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return b''.join(chunks)[:limit], True
+    return b''.join(chunks), False
+
+
+def _read_readme_body(response: requests.Response, url: str) -> str:
+    """
+    Read a streamed README response, keeping at most MAX_README_BYTES.
+
+    Invalid UTF-8 (including a character split by truncation) is replaced
+    rather than raising.
+    """
+    body, truncated = _read_limited(response, MAX_README_BYTES)
+    if truncated:
+        logger.warning("README at %s exceeds %s bytes, truncating", url, MAX_README_BYTES)
+    return body.decode('utf-8', errors='replace')
+
+
+def _cap_readme_text(text: str, source: str) -> str:
+    """Truncate already-decoded README text to at most MAX_README_BYTES of UTF-8."""
+    # A character is at most 4 bytes, so short texts cannot exceed the cap
+    if len(text) <= MAX_README_BYTES // 4:
+        return text
+    encoded = text.encode('utf-8')
+    if len(encoded) <= MAX_README_BYTES:
+        return text
+    logger.warning("README for %s exceeds %s bytes, truncating", source, MAX_README_BYTES)
+    return encoded[:MAX_README_BYTES].decode('utf-8', errors='replace')
+
+
+def _fetch_python_file(raw_url: str, timeout: float = 10) -> Optional[str]:
+    """Download a Python source file, or return None if it is missing, too large or unreadable."""
+    import requests
+
+    try:
+        with _get_http_session().get(raw_url, timeout=timeout, stream=True) as response:
+            if response.status_code != 200:
+                logger.debug("Python file not found: %s", raw_url)
+                return None
+            body, too_large = _read_limited(response, MAX_PYTHON_FILE_BYTES)
+        if too_large:
+            logger.warning("Python file %s exceeds %s bytes, skipping", raw_url, MAX_PYTHON_FILE_BYTES)
+            return None
+        return body.decode('utf-8')
+    except requests.RequestException:
+        logger.debug("Failed to fetch Python file: %s", raw_url)
+    except UnicodeDecodeError:
+        logger.debug("Python file is not valid UTF-8: %s", raw_url)
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_github_url(repo_url: str) -> Optional[Tuple[str, str]]:
+    """
+    Extract the owner and repository name from a GitHub repository URL.
+
+    Plain ``https://github.com/owner/repo`` URLs are split directly; anything
+    else (SSH URLs, other hosts or prefixes) is matched with _GITHUB_URL_RE.
+    Results are memoized, since each project URL is parsed by the API, raw
+    URL and Python fallback tiers in turn.
+
+    Args:
+        repo_url: GitHub repository URL
+
+    Returns:
+        Tuple of (owner, repo), or None if the URL is not a repository URL
+
+    Example:
+        >>> parse_github_url('https://github.com/owner/repo.git')
+        ('owner', 'repo')
+    """
+    if repo_url.startswith(_GITHUB_HTTPS_PREFIX):
+        path = repo_url[len(_GITHUB_HTTPS_PREFIX):].removesuffix('/')
+        owner, sep, repo = path.partition('/')
+        repo = repo.removesuffix('.git')
+        if sep and owner and repo and '/' not in repo:
+            return owner, repo
+
+    match = _GITHUB_URL_RE.search(repo_url)
+    if not match:
+        return None
+    return match.group(1), match.group(2)
+
+
+def fetch_raw_readme(
+    repo_url: str,
+    timeout: int = 10,
+    cache_dir: Optional[str] = None,
+    dry_run: bool = False
+) -> Optional[str]:
     """
     Fetch README content directly from raw.githubusercontent.com as a fallback.
 
     This function constructs a raw.githubusercontent.com URL and fetches the README
     content using standard HTTP requests. This is useful as a fallback when the
-    GitHub API rate limit has been exceeded.
+    GitHub API rate limit has been exceeded. Requests go through a per-thread
+    session, so the filename probes on each of RAW_README_BRANCHES share one
+    keep-alive connection instead of a TLS handshake each.
+
+    When a cache directory is given, previously fetched READMEs are
+    revalidated with If-None-Match/If-Modified-Since, and a 304 response
+    returns the cached body without downloading it again.
 
     Args:
         repo_url: GitHub repository URL (e.g., 'https://github.com/owner/repo')
-        branch: Branch name to fetch README from (default: 'main')
         timeout: Request timeout in seconds (default: 10)
+        cache_dir: Optional directory for conditional GET cache entries
+        dry_run: If True, use existing cache entries but do not write new ones
 
     Returns:
         README content as string if successful, None if failed
@@ -279,62 +689,147 @@ def fetch_raw_readme(repo_url: str, branch: str = "main", timeout: int = 10) ->
         >>> if content:
         ...     print("README fetched successfully via raw URL")
     """
-    logger = logging.getLogger(__name__)
+    import requests
 
     # Extract owner and repo from URL
-    # Handle both github.com and github.com/ formats
-    url_pattern = re.compile(r'github\.com[/:]?([^/]+)/([^/]+?)(?:\.git)?/?$')
-    match = url_pattern.search(repo_url)
+    parsed = parse_github_url(repo_url)
 
-    if not match:
+    if not parsed:
         logger.error(f"Could not parse repository URL: {repo_url}")
         return None
 
-    owner, repo = match.groups()
-    logger.debug(f"Parsed owner={owner}, repo={repo} from URL")
+    owner, repo = parsed
+    logger.debug("Parsed owner=%s, repo=%s from URL", owner, repo)
 
-    # Construct raw.githubusercontent.com URL
-    # Try common README filenames
-    readme_filenames = ['README.md', 'README.markdown', 'README.rst', 'README']
+    session = _get_http_session()
 
-    for readme_name in readme_filenames:
-        raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{readme_name}"
-        logger.debug(f"Attempting to fetch from: {raw_url}")
+    # Try each common README filename on main, then on master
+    for branch in RAW_README_BRANCHES:
+        for readme_name in README_FILENAMES:
+            raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{readme_name}"
+            logger.debug("Attempting to fetch from: %s", raw_url)
+            cached = load_http_cache_entry(cache_dir, raw_url) if cache_dir else None
 
-        try:
-            logger.debug(f"Fetching README from raw.githubusercontent.com for {owner}/{repo}")
-            req = urllib.request.Request(
-                raw_url,
-                headers={'User-Agent': 'Mozilla/5.0'}
-            )
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                content = response.read().decode('utf-8')
-                logger.info(f"Successfully fetched {readme_name} from raw.githubusercontent.com")
-                return content
-
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                logger.debug(f"{readme_name} not found on {branch} branch")
+            try:
+                logger.debug("Fetching README from raw.githubusercontent.com for %s/%s", owner, repo)
+                headers = {}
+                if cached:
+                    if cached.get('etag'):
+                        headers['If-None-Match'] = cached['etag']
+                    if cached.get('last_modified'):
+                        headers['If-Modified-Since'] = cached['last_modified']
+
+                with session.get(raw_url, headers=headers, timeout=timeout, stream=True) as response:
+                    if response.status_code == 200:
+                        content = _read_readme_body(response, raw_url)
+                        logger.info(f"Successfully fetched {readme_name} from raw.githubusercontent.com")
+                        if cache_dir and not dry_run:
+                            save_http_cache_entry(
+                                cache_dir,
+                                raw_url,
+                                response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'),
+                                content
+                            )
+                        return content
+                    elif response.status_code == 304 and cached:
+                        logger.info(f"{readme_name} not modified, using cached copy for {owner}/{repo}")
+                        return cached['body']
+                    elif response.status_code == 404:
+                        logger.debug("%s not found on %s branch", readme_name, branch)
+                        continue
+                    else:
+                        logger.warning(f"HTTP error {response.status_code} fetching {raw_url}")
+                        continue
+
+            except requests.RequestException as e:
+                logger.warning(f"Request error fetching {raw_url}: {e}")
                 continue
-            else:
-                logger.warning(f"HTTP error {e.code} fetching {raw_url}: {e}")
+
+            except Exception as e:
+                logger.error(f"Unexpected error fetching {raw_url}: {e}")
                 continue
 
-        except urllib.error.URLError as e:
-            logger.warning(f"URL error fetching {raw_url}: {e}")
-            continue
+    logger.warning(f"Could not fetch README from raw.githubusercontent.com for {repo_url}")
+    return None
 
-        except Exception as e:
-            logger.error(f"Unexpected error fetching {raw_url}: {e}")
+
+def fetch_readmes_graphql(
+    token: str,
+    repo_urls: List[str],
+    batch_size: int = 50,
+    timeout: int = 30
+) -> Dict[str, str]:
+    """
+    Fetch README.md for many repositories through the GitHub GraphQL API.
+
+    Each request aliases up to ``batch_size`` repositories in a single query,
+    so fetching N READMEs costs ceil(N / batch_size) round trips instead of
+    one REST call per repository. Batches are posted on the calling thread's
+    HTTP session, so they share one keep-alive connection. The GraphQL API
+    requires authentication, so nothing is fetched without a token.
+
+    Args:
+        token: GitHub Personal Access Token
+        repo_urls: GitHub repository URLs to fetch READMEs for
+        batch_size: Number of repositories per GraphQL query (default: 50)
+        timeout: Request timeout in seconds (default: 30)
+
+    Returns:
+        Dictionary mapping repository URL to README content. Repositories
+        without a README.md at HEAD, or in a batch that failed, are omitted
+        so callers can fall back to per-repository fetching.
+    """
+    import requests
+
+    readmes: Dict[str, str] = {}
+
+    if not token:
+        logger.debug("No GitHub token provided, skipping GraphQL README batch fetch")
+        return readmes
+
+    session = _get_http_session()
+
+    # Resolve each URL to owner/repo once; unparseable URLs are left to the caller
+    repos = []
+    for repo_url in dict.fromkeys(repo_urls):
+        parsed = parse_github_url(repo_url)
+        if parsed:
+            repos.append((repo_url, *parsed))
+
+    for start in range(0, len(repos), batch_size):
+        batch = repos[start:start + batch_size]
+        fields = [
+            f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) {{ '
+            f'readme: object(expression: "HEAD:README.md") {{ ... on Blob {{ text }} }} }}'
+            for i, (_, owner, repo) in enumerate(batch)
+        ]
+        query = "query {\n  " + "\n  ".join(fields) + "\n}"
+
+        logger.debug("Fetching %s READMEs via GraphQL (batch starting at %s)", len(batch), start)
+        try:
+            response = session.post(
+                GITHUB_GRAPHQL_URL,
+                json={"query": query},
+                headers={'Authorization': f'bearer {token}'},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"GraphQL README batch fetch failed: {e}")
             continue
 
-    # If main branch failed, try master branch
-    if branch == "main":
-        logger.debug("README not found on main branch, trying master branch")
-        return fetch_raw_readme(repo_url, branch="master", timeout=timeout)
+        # Missing repositories are reported in 'errors' alongside partial data
+        data = payload.get('data') or {}
+        for i, (repo_url, _, _) in enumerate(batch):
+            repository = data.get(f'r{i}') or {}
+            readme = repository.get('readme') or {}
+            if readme.get('text'):
+                readmes[repo_url] = _cap_readme_text(readme['text'], repo_url)
 
-    logger.warning(f"Could not fetch README from raw.githubusercontent.com for {repo_url}")
-    return None
+    logger.info(f"Fetched {len(readmes)} of {len(repos)} READMEs via GraphQL")
+    return readmes
 
 
 def parse_main_readme(readme_path: str) -> Dict[str, List[Project]]:
@@ -356,7 +851,6 @@ def parse_main_readme(readme_path: str) -> Dict[str, List[Project]]:
         FileNotFoundError: If the readme_path does not exist
         ValueError: If the README format is invalid
     """
-    logger = logging.getLogger(__name__)
     logger.info(f"Parsing main README: {readme_path}")
 
     readme_file = Path(readme_path)
@@ -373,43 +867,38 @@ def parse_main_readme(readme_path: str) -> Dict[str, List[Project]]:
     # Dictionary to store categories and their projects
     categories: Dict[str, List[Project]] = {}
     current_category = "Uncategorized"
+    # List for current_category, created on its first header or project
+    current_projects: Optional[List[Project]] = None
 
-    # Regex patterns
-    category_pattern = re.compile(r"^##\s+(.+)$", re.MULTILINE)
-    project_pattern = re.compile(
-        r"-\s+\[([^\]]+)\]\(([^)]+)\)\s*(?:-\s*(.+))?$",
-        re.MULTILINE
-    )
+    # One combined match per line instead of separate category/project matches
+    for line in content.split("\n"):
+        match = _README_LINE_RE.match(line)
+        if match is None:
+            continue
 
-    # Split content into lines for processing
-    lines = content.split("\n")
-
-    for line in lines:
-        # Check if line is a category header
-        category_match = category_pattern.match(line.strip())
-        if category_match:
-            current_category = category_match.group(1).strip()
-            logger.debug(f"Found category: {current_category}")
-            if current_category not in categories:
-                categories[current_category] = []
+        category = match.group('category')
+        if category is not None:
+            current_category = category.strip()
+            logger.debug("Found category: %s", current_category)
+            current_projects = categories.setdefault(current_category, [])
             continue
 
-        # Check if line is a project entry
-        project_match = project_pattern.match(line.strip())
-        if project_match:
-            title = project_match.group(1).strip()
-            url = project_match.group(2).strip()
-            description = project_match.group(3).strip() if project_match.group(3) else None
-
-            project = Project(
-                title=title,
-                url=url,
-                description=description,
-                category=current_category
-            )
+        title = match.group('title').strip()
+        url = match.group('url').strip()
+        description = match.group('description')
+        description = description.strip() if description else None
+
+        project = Project(
+            title=title,
+            url=url,
+            description=description,
+            category=current_category
+        )
 
-            categories.setdefault(current_category, []).append(project)
-            logger.debug(f"Added project '{title}' to category '{current_category}'")
+        if current_projects is None:
+            current_projects = categories.setdefault(current_category, [])
+        current_projects.append(project)
+        logger.debug("Added project '%s' to category '%s'", title, current_category)
 
     # Summary statistics
     total_projects = sum(len(projects) for projects in categories.values())
@@ -422,6 +911,26 @@ def parse_main_readme(readme_path: str) -> Dict[str, List[Project]]:
     return categories
 
 
+def _get_markdown_converter(extras: Tuple[str, ...]) -> markdown2.Markdown:
+    """
+    Return a reusable markdown2 converter for the given extras.
+
+    markdown2.markdown() builds a new Markdown instance on every call, while
+    Markdown.convert() resets its state itself, so one instance can be reused.
+    Instances are kept per thread because a converter is not thread-safe.
+    """
+    converters = getattr(_markdown_converters, 'by_extras', None)
+    if converters is None:
+        converters = _markdown_converters.by_extras = {}
+
+    converter = converters.get(extras)
+    if converter is None:
+        import markdown2
+
+        converter = converters[extras] = markdown2.Markdown(extras=list(extras))
+    return converter
+
+
 def convert_markdown_to_html(markdown_content: str, extras: Optional[List[str]] = None) -> str:
     """
     Convert markdown content to HTML using markdown2 library.
@@ -439,8 +948,6 @@ def convert_markdown_to_html(markdown_content: str, extras: Optional[List[str]]
     Raises:
         ValueError: If markdown_content is empty or None
     """
-    logger = logging.getLogger(__name__)
-
     if not markdown_content:
         logger.error("Markdown content is empty or None")
         raise ValueError("Markdown content cannot be empty or None")
@@ -450,10 +957,7 @@ def convert_markdown_to_html(markdown_content: str, extras: Optional[List[str]]
         extras = ['tables', 'fenced-code-blocks', 'code-friendly', 'header-ids']
 
     try:
-        html = markdown2.markdown(
-            markdown_content,
-            extras=extras
-        )
+        html = _get_markdown_converter(tuple(extras)).convert(markdown_content)
         logger.debug("Successfully converted markdown to HTML")
         return html
     except Exception as e:
@@ -461,7 +965,28 @@ def convert_markdown_to_html(markdown_content: str, extras: Optional[List[str]]
         raise
 
 
-def extract_python_metadata(file_path: str) -> Optional[Dict[str, Any]]:
+def _first_docstring_line(docstring: Optional[str]) -> Optional[str]:
+    """Return the first non-empty line of a docstring, truncated to 200 characters."""
+    if not docstring:
+        return None
+
+    for line in docstring.strip().split('\n'):
+        line = line.strip()
+        if line:
+            return line[:200] + '...' if len(line) > 200 else line
+    return None
+
+
+def _python_metadata_cache_path(cache_dir: str, file_path: str) -> Path:
+    """Return the cache file path used for a Python file's extracted metadata."""
+    digest = hashlib.sha1(file_path.encode('utf-8')).hexdigest()
+    return Path(cache_dir) / "pymeta" / f"{digest}.json"
+
+
+def extract_python_metadata(
+    file_path: str,
+    cache_dir: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
     """
     Extract metadata from a Python file using AST parsing.
 
@@ -469,8 +994,13 @@ def extract_python_metadata(file_path: str) -> Optional[Dict[str, Any]]:
     and extracts structured information about the module, functions, and classes.
     It includes module-level and function/class docstrings to generate descriptions.
 
+    When a cache directory is given, the result is stored keyed by the file's
+    path, modification time and size, and reused without reparsing while the
+    file is unchanged.
+
     Args:
         file_path: Path to the Python file to parse
+        cache_dir: Optional directory for cached metadata
 
     Returns:
         Dictionary containing:
@@ -496,50 +1026,92 @@ def extract_python_metadata(file_path: str) -> Optional[Dict[str, Any]]:
         ...     for func in metadata['functions']:
         ...         print(f"  - {func['name']} at line {func['lineno']}")
     """
-    logger = logging.getLogger(__name__)
-    logger.debug(f"Extracting Python metadata from: {file_path}")
+    logger.debug("Extracting Python metadata from: %s", file_path)
 
-    # Validate file exists
+    # Validate file exists; the same stat result keys the metadata cache
     python_file = Path(file_path)
-    if not python_file.exists():
+    try:
+        stat = python_file.stat()
+    except (OSError, ValueError):
         logger.error(f"Python file not found: {file_path}")
         return None
 
+    cache_file = None
+    cache_key = None
+    if cache_dir:
+        cache_key = f"{stat.st_mtime_ns}_{stat.st_size}"
+        cache_file = _python_metadata_cache_path(cache_dir, str(python_file))
+        try:
+            cached = json.loads(cache_file.read_text(encoding='utf-8'))
+            if cached.get('key') == cache_key:
+                logger.debug("Using cached metadata for %s", file_path)
+                return cached['metadata']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+    try:
+        # Read the file content
+        content = python_file.read_text(encoding='utf-8')
+    except IOError as e:
+        logger.error(f"Failed to read file {file_path}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error extracting metadata from {file_path}: {e}")
+        return None
+
+    metadata = extract_python_metadata_from_source(content, str(python_file))
+
+    if metadata is not None and cache_file:
+        try:
+            _write_json_atomic(cache_file, {'key': cache_key, 'metadata': metadata})
+        except OSError as e:
+            logger.warning(f"Failed to write metadata cache for {file_path}: {e}")
+
+    return metadata
+
+
+def extract_python_metadata_from_source(
+    source: str,
+    filename: str = '<remote>'
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract metadata from Python source code that is already in memory.
+
+    Used for files downloaded during Tier 3, which are parsed directly
+    instead of being written to a temporary file first.
+
+    Args:
+        source: Python source code
+        filename: Name or URL of the source, used for 'name', 'file_path'
+                  and error messages (default: '<remote>')
+
+    Returns:
+        Dictionary with the same structure as extract_python_metadata(), or
+        None if the source cannot be parsed
+    """
     # Initialize result structure with name and description
     metadata = {
-        'name': python_file.stem,
+        'name': Path(filename).stem,
         'description': None,
         'functions': [],
         'classes': [],
-        'file_path': str(python_file)
+        'file_path': filename
     }
 
     try:
-        # Read the file content
-        content = python_file.read_text(encoding='utf-8')
-
         # Parse the AST
-        tree = ast.parse(content, filename=str(python_file))
-
-        # Extract module-level docstring as the primary description
-        module_docstring = ast.get_docstring(tree)
-        if module_docstring:
-            # Use the first line or first sentence as the description
-            description_lines = module_docstring.strip().split('\n')
-            if description_lines:
-                # Take the first non-empty line as the description
-                for line in description_lines:
-                    line = line.strip()
-                    if line:
-                        # Truncate to a reasonable length if needed
-                        metadata['description'] = line[:200] + '...' if len(line) > 200 else line
-                        break
-            logger.debug(f"Extracted module docstring as description")
-
-        # Track methods to exclude them from top-level functions
-        method_names = set()
-
-        # Extract classes first to track their methods
+        tree = ast.parse(source, filename=filename)
+
+        # Description candidates in priority order: module docstring, first
+        # class docstring, then the docstring of a top-level main() function
+        module_description = _first_docstring_line(ast.get_docstring(tree))
+        if module_description:
+            logger.debug("Extracted module docstring as description")
+        class_description = None
+        main_description = None
+
+        # Single pass over the module body; methods live in class bodies, so
+        # top-level FunctionDef nodes are always module functions
         for node in tree.body:
             if isinstance(node, ast.ClassDef):
                 class_info = {
@@ -552,7 +1124,6 @@ def extract_python_metadata(file_path: str) -> Optional[Dict[str, Any]]:
                 # Extract methods from the class
                 for item in node.body:
                     if isinstance(item, ast.FunctionDef):
-                        method_names.add(item.name)
                         method_info = {
                             'name': item.name,
                             'lineno': item.lineno,
@@ -560,24 +1131,15 @@ def extract_python_metadata(file_path: str) -> Optional[Dict[str, Any]]:
                             'docstring': ast.get_docstring(item)
                         }
                         class_info['methods'].append(method_info)
-                        logger.debug(f"Found method '{item.name}' in class '{node.name}'")
+                        logger.debug("Found method '%s' in class '%s'", item.name, node.name)
 
                 metadata['classes'].append(class_info)
-                logger.debug(f"Found class '{node.name}' at line {node.lineno}")
-
-                # If we don't have a description yet, try using the first class's docstring
-                if not metadata['description'] and class_info['docstring']:
-                    desc_lines = class_info['docstring'].strip().split('\n')
-                    if desc_lines:
-                        for line in desc_lines:
-                            line = line.strip()
-                            if line:
-                                metadata['description'] = line[:200] + '...' if len(line) > 200 else line
-                                break
+                logger.debug("Found class '%s' at line %s", node.name, node.lineno)
 
-        # Extract top-level function definitions (excluding methods)
-        for node in tree.body:
-            if isinstance(node, ast.FunctionDef) and node.name not in method_names:
+                if not class_description:
+                    class_description = _first_docstring_line(class_info['docstring'])
+
+            elif isinstance(node, ast.FunctionDef):
                 func_info = {
                     'name': node.name,
                     'lineno': node.lineno,
@@ -585,37 +1147,67 @@ def extract_python_metadata(file_path: str) -> Optional[Dict[str, Any]]:
                     'docstring': ast.get_docstring(node)
                 }
                 metadata['functions'].append(func_info)
-                logger.debug(f"Found function '{node.name}' at line {node.lineno}")
-
-                # If we still don't have a description, try the main function's docstring
-                if not metadata['description'] and node.name == 'main' and func_info['docstring']:
-                    desc_lines = func_info['docstring'].strip().split('\n')
-                    if desc_lines:
-                        for line in desc_lines:
-                            line = line.strip()
-                            if line:
-                                metadata['description'] = line[:200] + '...' if len(line) > 200 else line
-                                break
+                logger.debug("Found function '%s' at line %s", node.name, node.lineno)
+
+                if node.name == 'main' and not main_description:
+                    main_description = _first_docstring_line(func_info['docstring'])
+
+        metadata['description'] = module_description or class_description or main_description
 
         # Log summary
         logger.info(
             f"Extracted metadata: {len(metadata['functions'])} functions, "
-            f"{len(metadata['classes'])} classes from {file_path}"
+            f"{len(metadata['classes'])} classes from {filename}"
         )
 
         return metadata
 
     except SyntaxError as e:
-        logger.warning(f"Syntax error in {file_path}: {e}. File cannot be parsed.")
-        return None
-    except IOError as e:
-        logger.error(f"Failed to read file {file_path}: {e}")
+        logger.warning(f"Syntax error in {filename}: {e}. File cannot be parsed.")
         return None
     except Exception as e:
-        logger.error(f"Unexpected error extracting metadata from {file_path}: {e}")
+        logger.error(f"Unexpected error extracting metadata from {filename}: {e}")
         return None
 
 
+def extract_python_metadata_batch(
+    file_paths: List[str],
+    max_workers: Optional[int] = None,
+    chunksize: int = 16,
+    cache_dir: Optional[str] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Extract metadata from many Python files in parallel.
+
+    AST parsing is CPU-bound, so files are spread across worker processes
+    rather than threads. A single file is parsed in-process to avoid the
+    cost of starting a pool.
+
+    Args:
+        file_paths: Paths to the Python files to parse
+        max_workers: Maximum number of worker processes (default: CPU count)
+        chunksize: Number of files handed to a worker at a time (default: 16)
+        cache_dir: Optional directory for cached metadata
+
+    Returns:
+        List of metadata dictionaries (or None for files that could not be
+        parsed), in the same order as file_paths
+    """
+    extract = functools.partial(extract_python_metadata, cache_dir=cache_dir)
+
+    if len(file_paths) <= 1:
+        return [extract(file_path) for file_path in file_paths]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(extract, file_paths, chunksize=chunksize))
+
+
+@functools.lru_cache(maxsize=None)
+def _category_dir_name(category: str) -> str:
+    """Return the directory name for a category, with path separators replaced."""
+    return category.replace('/', '-').replace('\\', '-')
+
+
 def create_output_structure(output_dir: str, categories: Dict[str, List[Project]]) -> None:
     """
     Create output directory structure mirroring the category hierarchy.
@@ -636,33 +1228,28 @@ def create_output_structure(output_dir: str, categories: Dict[str, List[Project]
         >>> create_output_structure("output", categories)
         # Creates: output/, output/AI Tools/, output/Chatbots/
     """
-    logger = logging.getLogger(__name__)
     logger.info(f"Creating output directory structure: {output_dir}")
 
     output_path = Path(output_dir)
 
     try:
-        # Create base output directory if it doesn't exist
-        if not output_path.exists():
-            output_path.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created base output directory: {output_path}")
-        else:
-            logger.debug(f"Base output directory already exists: {output_path}")
+        # Create base output directory; exist_ok makes this a no-op if present
+        output_path.mkdir(parents=True, exist_ok=True)
+        logger.debug("Base output directory ready: %s", output_path)
 
         # Create subdirectories for each category
         category_dirs_created = 0
         for category_name in categories.keys():
-            # Sanitize category name for use as directory name
-            # Replace special characters that aren't safe in file paths
-            safe_category_name = category_name.replace('/', '-').replace('\\', '-')
-            category_path = output_path / safe_category_name
-
-            if not category_path.exists():
-                category_path.mkdir(parents=True, exist_ok=True)
-                logger.debug(f"Created category directory: {category_path}")
+            category_path = output_path / _category_dir_name(category_name)
+
+            # The parent exists, so mkdir either creates the directory or
+            # raises FileExistsError - one syscall instead of stat + mkdir
+            try:
+                category_path.mkdir()
+                logger.debug("Created category directory: %s", category_path)
                 category_dirs_created += 1
-            else:
-                logger.debug(f"Category directory already exists: {category_path}")
+            except FileExistsError:
+                logger.debug("Category directory already exists: %s", category_path)
 
         logger.info(
             f"Output structure complete: {len(categories)} categories, "
@@ -674,13 +1261,78 @@ def create_output_structure(output_dir: str, categories: Dict[str, List[Project]
         raise
 
 
+def _plain_yaml_scalar(value: Any) -> bool:
+    """
+    Check whether a value is a string PyYAML would emit unquoted as-is.
+
+    Only a conservative subset is accepted: printable ASCII starting with a
+    letter, with no indicator sequences and no reserved words. Anything else
+    is left to PyYAML.
+    """
+    return (
+        isinstance(value, str)
+        and value.isascii()
+        and value.isprintable()
+        and value[:1].isalpha()
+        and not value.endswith((' ', ':'))
+        and ': ' not in value
+        and ' #' not in value
+        and value.lower() not in _YAML_RESERVED_WORDS
+    )
+
+
+def _dump_frontmatter(metadata: Dict[str, Any]) -> str:
+    """
+    Serialize frontmatter metadata to YAML.
+
+    Flat string metadata (the title/url/category/description schema written
+    by this script) is emitted with plain string joins; any other metadata is
+    passed to PyYAML. Both paths produce identical text.
+    """
+    keys = sorted(metadata) if all(isinstance(key, str) for key in metadata) else None
+    if keys and all(
+        _plain_yaml_scalar(key)
+        and _plain_yaml_scalar(metadata[key])
+        and len(key) + len(metadata[key]) + 2 <= _YAML_LINE_WIDTH
+        for key in keys
+    ):
+        return '\n'.join(f"{key}: {metadata[key]}" for key in keys)
+
+    import yaml
+
+    return yaml.dump(
+        metadata,
+        Dumper=yaml.SafeDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+    ).strip()
+
+
+def render_frontmatter(metadata: Dict[str, Any], content: str) -> str:
+    """
+    Render metadata and content as a markdown document with YAML frontmatter.
+
+    Produces the same text as ``frontmatter.dumps(frontmatter.Post(...))``
+    without building an intermediate Post object per file.
+
+    Args:
+        metadata: Dictionary of frontmatter fields
+        content: The markdown content body
+
+    Returns:
+        The full document text, with surrounding whitespace stripped
+    """
+    metadata_yaml = _dump_frontmatter(metadata)
+    return f"---\n{metadata_yaml}\n---\n\n{content}".strip()
+
+
 def write_markdown_with_frontmatter(
     output_path: str,
     metadata: Dict[str, Any],
     content: str
 ) -> None:
     """
-    Write a markdown file with YAML frontmatter using python-frontmatter library.
+    Write a markdown file with YAML frontmatter.
 
     This function creates a markdown file with structured YAML frontmatter containing
     metadata about the content. The frontmatter is delimited by '---' markers and
@@ -706,8 +1358,7 @@ def write_markdown_with_frontmatter(
         >>> content = '# Introduction\\n\\nThis is the content.'
         >>> write_markdown_with_frontmatter('output/project.md', metadata, content)
     """
-    logger = logging.getLogger(__name__)
-    logger.debug(f"Writing markdown with frontmatter to: {output_path}")
+    logger.debug("Writing markdown with frontmatter to: %s", output_path)
 
     # Validate inputs
     if not metadata:
@@ -720,24 +1371,23 @@ def write_markdown_with_frontmatter(
         raise ValueError("Content must be a string")
 
     try:
-        # Create frontmatter Post object with metadata and content
-        post = frontmatter.Post(content, **metadata)
+        document = render_frontmatter(metadata, content)
 
         # Ensure output directory exists
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to string with frontmatter and write to file
+        # Write the whole document in a single call
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(frontmatter.dumps(post))
+            f.write(document)
 
         logger.info(f"Successfully wrote markdown file: {output_path}")
 
         # Log metadata fields for debugging
         if logger.isEnabledFor(logging.DEBUG):
             metadata_keys = ', '.join(metadata.keys())
-            logger.debug(f"Frontmatter fields: {metadata_keys}")
-            logger.debug(f"Content length: {len(content)} characters")
+            logger.debug("Frontmatter fields: %s", metadata_keys)
+            logger.debug("Content length: %s characters", len(content))
 
     except OSError as e:
         logger.error(f"Failed to write file {output_path}: {e}")
@@ -750,7 +1400,8 @@ def write_markdown_with_frontmatter(
 def generate_project_output(
     project: Project,
     output_dir: str,
-    content: str = ""
+    content: str = "",
+    dry_run: bool = False
 ) -> None:
     """
     Generate markdown output file for a project with frontmatter metadata.
@@ -763,23 +1414,28 @@ def generate_project_output(
         project: Project object containing title, URL, description, and category
         output_dir: Base output directory path
         content: Optional markdown content body (defaults to placeholder text)
+        dry_run: If True, only log the path that would be written
 
     Raises:
         OSError: If file writing fails
     """
-    logger = logging.getLogger(__name__)
-    logger.debug(f"Generating output for project: {project.title}")
+    logger.debug("Generating output for project: %s", project.title)
 
-    # Sanitize category name for filesystem
-    safe_category_name = project.category.replace('/', '-').replace('\\', '-')
-    category_dir = Path(output_dir) / safe_category_name
+    # Category names are sanitized once per category, not once per project
+    category_dir = Path(output_dir) / _category_dir_name(project.category)
 
     # Sanitize project title for filename
     safe_title = project.title.replace('/', '-').replace('\\', '-').replace(' ', '_')
     output_filename = f"{safe_title}.md"
     output_path = category_dir / output_filename
 
-    logger.debug(f"Output path: {output_path}")
+    logger.debug("Output path: %s", output_path)
+
+    # Skip building and writing the file in dry-run mode
+    if dry_run:
+        logger.info(f"[DRY-RUN] Would create output file: {output_path}")
+        logger.debug("  Metadata: title=%s, category=%s", project.title, project.category)
+        return
 
     # Build metadata dictionary
     metadata = {
@@ -801,21 +1457,17 @@ def generate_project_output(
         content += "---\n\n"
         content += "*This content was automatically generated. The full README will be added in a later implementation phase.*\n"
 
-    # Skip writing in dry-run mode
-    logger = logging.getLogger(__name__)
-    if logger.isEnabledFor(logging.INFO):
-        import sys
-        if '--dry-run' in sys.argv:
-            logger.info(f"[DRY-RUN] Would create output file: {output_path}")
-            logger.debug(f"  Metadata: title={project.title}, category={project.category}")
-            return
-
     # Write the markdown file with frontmatter
     write_markdown_with_frontmatter(str(output_path), metadata, content)
     logger.info(f"Created output file: {output_path}")
 
 
-def fetch_project_readme(github_client: Github, project: Project) -> Optional[str]:
+def fetch_project_readme(
+    github_client: Github,
+    project: Project,
+    cache_dir: Optional[str] = None,
+    dry_run: bool = False
+) -> Optional[str]:
     """
     Fetch a project's README using GitHub API with fallback to raw URLs.
 
@@ -823,35 +1475,79 @@ def fetch_project_readme(github_client: Github, project: Project) -> Optional[st
     README content using the GitHub API. If the API fails (e.g., due to rate
     limits), it falls back to fetching via raw.githubusercontent.com URLs.
 
+    The API's README endpoint resolves the file name and default branch in a
+    single request, so when it reports that no README exists the raw URL
+    filename/branch probes are skipped.
+
+    When a cache directory is given, API responses are stored with their ETag
+    and later requests are sent with If-None-Match. GitHub answers unchanged
+    READMEs with 304 Not Modified, which does not count against the quota.
+
     Args:
         github_client: Authenticated GitHub API client
         project: Project object containing the repository URL
+        cache_dir: Optional directory for conditional GET cache entries
+        dry_run: If True, use existing cache entries but do not write new ones
 
     Returns:
         README content as string if successful, None if all fetch attempts fail
     """
-    logger = logging.getLogger(__name__)
-    logger.debug(f"Fetching README for project: {project.title}")
+    from github.GithubException import UnknownObjectException
+
+    logger.debug("Fetching README for project: %s", project.title)
 
     try:
         # Extract owner/repo from URL
-        url_pattern = re.compile(r'github\.com[/:]?([^/]+)/([^/]+?)(?:\.git)?/?$')
-        match = url_pattern.search(project.url)
+        parsed = parse_github_url(project.url)
 
-        if not match:
+        if not parsed:
             logger.warning(f"Could not parse repository URL for {project.title}: {project.url}")
             return None
 
-        owner, repo = match.groups()
+        owner, repo = parsed
         repo_name = f"{owner}/{repo}"
-        logger.debug(f"Repository identifier: {repo_name}")
+        logger.debug("Repository identifier: %s", repo_name)
 
         # Tier 2a: Try GitHub API first
-        logger.debug(f"Attempting Tier 2a: GitHub API fetch for {project.title}")
-        def fetch_via_api(repo_name: str) -> str:
-            repo_obj = github_client.get_repo(repo_name)
-            readme = repo_obj.get_readme()
-            return readme.decoded_content.decode('utf-8')
+        logger.debug("Attempting Tier 2a: GitHub API fetch for %s", project.title)
+        readme_path = f"/repos/{repo_name}/readme"
+        readme_api_url = f"{GITHUB_API_URL}{readme_path}"
+
+        def fetch_via_api(repo_name: str) -> Optional[str]:
+            cached = load_http_cache_entry(cache_dir, readme_api_url) if cache_dir else None
+            request_headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else None
+
+            try:
+                response_headers, data = github_client.requester.requestJsonAndCheck(
+                    "GET", readme_path, headers=request_headers
+                )
+            except UnknownObjectException:
+                return ""
+
+            # 304 Not Modified comes back without a body
+            if data is None and cached:
+                logger.debug("README for %s not modified, using cached copy", repo_name)
+                return cached['body']
+
+            # READMEs over 1 MB are returned without inline content; leave
+            # those to the raw URL tier
+            if not data or data.get('encoding') != 'base64':
+                return None
+
+            raw = base64.b64decode(data['content'])
+            if len(raw) > MAX_README_BYTES:
+                logger.warning("README for %s exceeds %s bytes, truncating", repo_name, MAX_README_BYTES)
+            content = raw[:MAX_README_BYTES].decode('utf-8', errors='replace')
+            if cache_dir and not dry_run:
+                response_headers = {key.lower(): value for key, value in response_headers.items()}
+                save_http_cache_entry(
+                    cache_dir,
+                    readme_api_url,
+                    response_headers.get('etag'),
+                    response_headers.get('last-modified'),
+                    content
+                )
+            return content
 
         content = fetch_with_retry(github_client, fetch_via_api, repo_name)
 
@@ -859,9 +1555,13 @@ def fetch_project_readme(github_client: Github, project: Project) -> Optional[st
             logger.info(f"Tier 2a (GitHub API) succeeded for {project.title}")
             return content
 
+        if content == "":
+            logger.warning(f"GitHub API reports no README for {project.title}, skipping raw URL probes")
+            return None
+
         # Tier 2b: Fallback to raw.githubusercontent.com
-        logger.debug(f"Tier 2a failed, attempting Tier 2b: raw.githubusercontent.com for {project.title}")
-        content = fetch_raw_readme(project.url)
+        logger.debug("Tier 2a failed, attempting Tier 2b: raw.githubusercontent.com for %s", project.title)
+        content = fetch_raw_readme(project.url, cache_dir=cache_dir, dry_run=dry_run)
 
         if content:
             logger.info(f"Tier 2b (raw URL) succeeded for {project.title}")
@@ -875,11 +1575,53 @@ def fetch_project_readme(github_client: Github, project: Project) -> Optional[st
         return None
 
 
+def _fetch_project_readme_once(
+    github_client: Github,
+    project: Project,
+    readme_cache: Optional[Dict[str, str]] = None,
+    cache_dir: Optional[str] = None,
+    dry_run: bool = False
+) -> Optional[str]:
+    """
+    Fetch a project's README, sharing the result with concurrent callers.
+
+    The first caller for a URL runs fetch_project_readme() and stores the
+    result in readme_cache and on disk; callers that arrive while it is in
+    progress wait for and reuse its result without writing it again.
+    """
+    with _inflight_readmes_lock:
+        future = _inflight_readmes.get(project.url)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight_readmes[project.url] = Future()
+
+    if not is_owner:
+        logger.debug("Waiting for in-flight README fetch for %s", project.url)
+        return future.result()
+
+    try:
+        content = fetch_project_readme(github_client, project, cache_dir, dry_run)
+        if content and readme_cache is not None:
+            readme_cache[project.url] = content
+        if content and cache_dir and not dry_run:
+            save_cached_readme(cache_dir, project.url, content)
+        future.set_result(content)
+        return content
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_readmes_lock:
+            del _inflight_readmes[project.url]
+
+
 def process_project(
     project: Project,
     github_client: Github,
     output_dir: str,
-    readme_cache: Optional[Dict[str, str]] = None
+    readme_cache: Optional[Dict[str, str]] = None,
+    cache_dir: Optional[str] = None,
+    dry_run: bool = False
 ) -> bool:
     """
     Process a single project through the three-tier data fetching strategy.
@@ -894,12 +1636,13 @@ def process_project(
         github_client: Authenticated GitHub API client
         output_dir: Base output directory for generated files
         readme_cache: Optional cache mapping URLs to README content to avoid refetching
+        cache_dir: Optional directory for the on-disk README and HTTP caches
+        dry_run: If True, fetch as usual but do not write the output file
+                 or any cache entries
 
     Returns:
         True if project was processed successfully, False if all tiers failed
     """
-    logger = logging.getLogger(__name__)
-
     try:
         logger.info(f"Processing project: {project.title} (category: {project.category})")
 
@@ -907,15 +1650,13 @@ def process_project(
         readme_content = None
         if readme_cache and project.url in readme_cache:
             readme_content = readme_cache[project.url]
-            logger.debug(f"Using cached README for {project.title}")
+            logger.debug("Using cached README for %s", project.title)
 
         # Tier 2: Fetch README if not cached
         if not readme_content:
-            readme_content = fetch_project_readme(github_client, project)
-
-            # Cache the result if we got content
-            if readme_content and readme_cache is not None:
-                readme_cache[project.url] = readme_content
+            readme_content = _fetch_project_readme_once(
+                github_client, project, readme_cache, cache_dir, dry_run
+            )
 
         # Determine final content and metadata
         final_content = ""
@@ -928,7 +1669,7 @@ def process_project(
         if readme_content:
             # Tier 2 succeeded: Use README content
             logger.info(f"Tier 2 (README fetch) succeeded for {project.title}")
-            logger.debug(f"Using fetched README content for {project.title}")
+            logger.debug("Using fetched README content for %s", project.title)
             final_content = readme_content
             if project.description:
                 final_metadata['description'] = project.description
@@ -940,11 +1681,10 @@ def process_project(
             try:
                 # Try to infer Python file URL from project URL
                 # Common patterns: main.py, app.py, project_name.py
-                url_pattern = re.compile(r'github\.com[/:]?([^/]+)/([^/]+?)(?:\.git)?/?$')
-                match = url_pattern.search(project.url)
+                parsed = parse_github_url(project.url)
 
-                if match:
-                    owner, repo = match.groups()
+                if parsed:
+                    owner, repo = parsed
 
                     # List of common entry point files to try
                     common_filenames = [
@@ -955,74 +1695,52 @@ def process_project(
                         "__init__.py"
                     ]
 
-                    for filename in common_filenames:
-                        # Construct raw URL for Python file
-                        raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/{filename}"
-                        temp_file = None
+                    raw_urls = [
+                        f"https://raw.githubusercontent.com/{owner}/{repo}/main/{filename}"
+                        for filename in common_filenames
+                    ]
 
-                        try:
-                            # Download Python file to temp location for parsing
-                            logger.debug(f"Trying to fetch Python file: {filename}")
-                            req = urllib.request.Request(
-                                raw_url,
-                                headers={'User-Agent': 'Mozilla/5.0'}
-                            )
-                            with urllib.request.urlopen(req, timeout=10) as response:
-                                python_code = response.read().decode('utf-8')
-
-                                # Create temporary file for AST parsing
-                                import tempfile
-                                with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                                    f.write(python_code)
-                                    temp_file = f.name
-
-                                # Extract metadata using AST
-                                metadata = extract_python_metadata(temp_file)
-
-                                if metadata and metadata.get('description'):
-                                    logger.info(f"Tier 3 (Python AST) succeeded for {project.title}")
-                                    final_metadata['description'] = metadata['description']
-                                    final_metadata['python_metadata'] = metadata
-
-                                    # Build content from Python metadata
-                                    final_content = f"# {project.title}\n\n"
-                                    if metadata.get('description'):
-                                        final_content += f"{metadata['description']}\n\n"
-
-                                    if metadata.get('functions'):
-                                        final_content += "## Functions\n\n"
-                                        for func in metadata['functions'][:10]:  # Limit to first 10
-                                            final_content += f"- **{func['name']}**"
-                                            if func.get('docstring'):
-                                                final_content += f": {func['docstring'].split(chr(10))[0][:100]}"
-                                            final_content += "\n"
-
-                                    if metadata.get('classes'):
-                                        final_content += "\n## Classes\n\n"
-                                        for cls in metadata['classes'][:10]:  # Limit to first 10
-                                            final_content += f"- **{cls['name']}**"
-                                            if cls.get('docstring'):
-                                                final_content += f": {cls['docstring'].split(chr(10))[0][:100]}"
-                                            final_content += "\n"
-
-                                    break
-
-                        except urllib.error.HTTPError:
-                            logger.debug(f"Python file not found: {filename}")
-                            continue
-                        except urllib.error.URLError:
-                            logger.debug(f"Failed to fetch Python file: {filename}")
+                    # Request every candidate at once; results are still taken
+                    # in priority order, so the first file with a docstring wins
+                    downloads = _python_file_executor.map(_fetch_python_file, raw_urls)
+
+                    for filename, raw_url, python_code in zip(common_filenames, raw_urls, downloads):
+                        if python_code is None:
                             continue
+
+                        try:
+                            # Extract metadata using AST
+                            metadata = extract_python_metadata_from_source(python_code, raw_url)
+
+                            if metadata and metadata.get('description'):
+                                logger.info(f"Tier 3 (Python AST) succeeded for {project.title}")
+                                final_metadata['description'] = metadata['description']
+                                final_metadata['python_metadata'] = metadata
+
+                                # Build content from Python metadata
+                                parts = [f"# {project.title}\n\n"]
+                                if metadata.get('description'):
+                                    parts.append(f"{metadata['description']}\n\n")
+
+                                for heading, entries in (
+                                    ("## Functions\n\n", metadata.get('functions')),
+                                    ("\n## Classes\n\n", metadata.get('classes')),
+                                ):
+                                    if not entries:
+                                        continue
+                                    parts.append(heading)
+                                    for entry in entries[:10]:  # Limit to first 10
+                                        docstring = entry.get('docstring')
+                                        summary = f": {docstring.partition(chr(10))[0][:100]}" if docstring else ""
+                                        parts.append(f"- **{entry['name']}**{summary}\n")
+
+                                final_content = ''.join(parts)
+
+                                break
+
                         except Exception as e:
-                            logger.debug(f"Error processing Python file {filename}: {e}")
+                            logger.debug("Error processing Python file %s: %s", filename, e)
                             continue
-                        finally:
-                            # Clean up temp file
-                            if temp_file and Path(temp_file).exists():
-                                try:
-                                    Path(temp_file).unlink()
-                                except Exception:
-                                    pass
 
             except Exception as e:
                 logger.warning(f"Tier 3 (Python AST extraction) failed for {project.title}: {e}")
@@ -1043,7 +1761,7 @@ def process_project(
             final_metadata['description'] = project.description
 
         # Generate output file
-        generate_project_output(project, output_dir, final_content)
+        generate_project_output(project, output_dir, final_content, dry_run=dry_run)
         logger.info(f"Successfully processed {project.title}")
         return True
 
@@ -1074,15 +1792,15 @@ def main() -> int:
     logger.info("Starting Hybrid Data Fetcher for awesome-llm-apps")
 
     # Log configuration
-    logger.debug(f"Output directory: {args.output_dir}")
-    logger.debug(f"Skip cache: {args.skip_cache}")
-    logger.debug(f"Dry run: {args.dry_run}")
-    logger.debug(f"GitHub token provided: {bool(args.github_token)}")
+    logger.debug("Output directory: %s", args.output_dir)
+    logger.debug("Skip cache: %s", args.skip_cache)
+    logger.debug("Dry run: %s", args.dry_run)
+    logger.debug("GitHub token provided: %s", bool(args.github_token))
 
     try:
         # Initialize GitHub client
         logger.info("Initializing GitHub client")
-        github_client = get_github_client(args.github_token)
+        github_client = get_github_client(args.github_token, pool_size=max(1, args.workers))
 
         # Tier 1: Parse main README to extract project catalog
         logger.info("Tier 1: Parsing main README to extract project catalog")
@@ -1098,47 +1816,103 @@ def main() -> int:
         logger.info(f"Found {len(categories)} categories with {total_projects} total projects")
 
         # Create output directory structure
-        logger.info("Creating output directory structure")
-        create_output_structure(args.output_dir, categories)
+        if args.dry_run:
+            logger.info("Dry run - skipping output directory creation")
+        else:
+            logger.info("Creating output directory structure")
+            create_output_structure(args.output_dir, categories)
 
         # Initialize cache for README content
         readme_cache = {} if not args.skip_cache else None
-        cache_status = "enabled" if readme_cache else "disabled (--skip-cache)"
+        cache_dir = args.cache_dir if not args.skip_cache else None
+        cache_status = "enabled" if readme_cache is not None else "disabled (--skip-cache)"
         logger.info(f"README caching {cache_status}")
 
+        all_projects = [project for projects in categories.values() for project in projects]
+
+        # Seed the in-memory cache with READMEs fetched by recent runs
+        if cache_dir:
+            for project in all_projects:
+                cached_readme = load_cached_readme(cache_dir, project.url)
+                if cached_readme:
+                    readme_cache[project.url] = cached_readme
+            logger.info(f"Loaded {len(readme_cache)} READMEs from cache: {cache_dir}")
+
+        # Batch-fetch READMEs over GraphQL when authenticated; projects it
+        # misses still go through the per-repository API and raw URL tiers
+        if args.github_token:
+            logger.info("Prefetching project READMEs via GitHub GraphQL API")
+            prefetched = fetch_readmes_graphql(
+                args.github_token,
+                [project.url for project in all_projects
+                 if not readme_cache or project.url not in readme_cache]
+            )
+            if prefetched:
+                if readme_cache is None:
+                    readme_cache = {}
+                readme_cache.update(prefetched)
+                if cache_dir and not args.dry_run:
+                    for repo_url, content in prefetched.items():
+                        save_cached_readme(cache_dir, repo_url, content)
+
         # Process each project through the three-tier strategy
         logger.info("Tier 2 & 3: Fetching project READMEs with fallback to Python AST")
         logger.info(f"Starting to process {total_projects} projects across {len(categories)} categories")
         successful_count = 0
         failed_count = 0
 
-        for category_name, projects in categories.items():
-            logger.info(f"Processing category: {category_name} ({len(projects)} projects)")
-
-            for idx, project in enumerate(projects, 1):
-                try:
-                    # Log progress every 10 projects or for the last project
-                    if idx % 10 == 0 or idx == len(projects):
-                        logger.debug(f"Progress: {idx}/{len(projects)} projects in category '{category_name}'")
-
-                    success = process_project(
+        # Fetching is network-bound, so run projects on a thread pool and
+        # collect each result as soon as it finishes, so one slow project does
+        # not hold back progress reporting for the projects queued behind it
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            futures = {}
+            for category_name, projects in categories.items():
+                logger.info(f"Processing category: {category_name} ({len(projects)} projects)")
+                for project in projects:
+                    future = executor.submit(
+                        process_project,
                         project,
                         github_client,
                         args.output_dir,
-                        readme_cache
+                        readme_cache,
+                        cache_dir,
+                        args.dry_run
                     )
+                    futures[future] = (category_name, project)
 
-                    if success:
-                        successful_count += 1
-                    else:
-                        failed_count += 1
+            completed_by_category = {category_name: 0 for category_name in categories}
+            successful_by_category = {category_name: 0 for category_name in categories}
+
+            for future in as_completed(futures):
+                category_name, project = futures[future]
+                category_size = len(categories[category_name])
 
+                try:
+                    success = future.result()
                 except Exception as e:
                     logger.error(f"Error processing project {project.title}: {e}", exc_info=True)
+                    success = False
+
+                if success:
+                    successful_count += 1
+                    successful_by_category[category_name] += 1
+                else:
                     failed_count += 1
 
-            # Log category completion
-            logger.info(f"Completed category '{category_name}': {successful_count} successful, {failed_count} failed")
+                completed_by_category[category_name] += 1
+                completed = completed_by_category[category_name]
+
+                # Log progress every 10 projects or for the last project
+                if completed % 10 == 0 or completed == category_size:
+                    logger.debug("Progress: %s/%s projects in category '%s'", completed, category_size, category_name)
+
+                # Log category completion
+                if completed == category_size:
+                    category_successful = successful_by_category[category_name]
+                    logger.info(
+                        f"Completed category '{category_name}': {category_successful} successful, "
+                        f"{completed - category_successful} failed"
+                    )
 
         # Log summary
         logger.info("=" * 60)
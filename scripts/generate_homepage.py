@@ -22,6 +22,11 @@ from typing import Dict, List, Optional, Any
 from urllib.parse import quote
 
 
+# Matches the YAML frontmatter block (between --- delimiters) at the start of
+# a markdown file and captures its text
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+
 def parse_simple_yaml_frontmatter(yaml_text: str) -> Dict[str, Any]:
     """
     Parse simple YAML frontmatter without external dependencies.
@@ -207,14 +212,14 @@ def gather_agent_metadata(output_dir: str) -> Dict[str, List[AgentMetadata]]:
     # Process each markdown file
     for md_file in markdown_files:
         try:
-            logger.debug(f"Processing file: {md_file}")
+            logger.debug("Processing file: %s", md_file)
 
             # Read file content and parse frontmatter
             with open(md_file, 'r', encoding='utf-8') as f:
                 content = f.read()
 
             # Extract YAML frontmatter (between --- delimiters)
-            frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n(.*)$', content, re.DOTALL)
+            frontmatter_match = _FRONTMATTER_RE.match(content)
 
             if not frontmatter_match:
                 logger.warning(f"No frontmatter found in {md_file}, skipping")
@@ -353,7 +358,7 @@ Discover the most popular and innovative LLM agents, frameworks, and tools.
     # Generate category sections with agent cards
     for category_name in sorted(agents_by_category.keys()):
         agents = agents_by_category[category_name]
-        logger.debug(f"Generating category section: {category_name} ({len(agents)} agents)")
+        logger.debug("Generating category section: %s (%s agents)", category_name, len(agents))
 
         # Sort agents alphabetically by title
         sorted_agents = sorted(agents, key=lambda a: a.title.lower())
@@ -481,9 +486,9 @@ def main() -> int:
     logger.info("Starting Homepage Generator")
 
     # Log configuration
-    logger.debug(f"Output directory: {args.output_dir}")
-    logger.debug(f"Output file: {args.output}")
-    logger.debug(f"Dry run: {args.dry_run}")
+    logger.debug("Output directory: %s", args.output_dir)
+    logger.debug("Output file: %s", args.output)
+    logger.debug("Dry run: %s", args.dry_run)
 
     try:
         # Gather agent metadata from markdown files
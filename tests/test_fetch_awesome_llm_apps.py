@@ -8,24 +8,72 @@ Tests the three core components:
 """
 
 import ast
+import logging
 import tempfile
-import urllib.error
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import requests
 
 from scripts.fetch_awesome_llm_apps import (
     Project,
+    _fetch_python_file,
+    _get_http_session,
+    convert_markdown_to_html,
     extract_python_metadata,
+    extract_python_metadata_batch,
+    extract_python_metadata_from_source,
     fetch_raw_readme,
+    fetch_readmes_graphql,
     fetch_with_retry,
     fetch_project_readme,
+    generate_project_output,
     get_github_client,
+    load_cached_readme,
+    load_http_cache_entry,
     parse_main_readme,
+    process_project,
+    parse_github_url,
+    render_frontmatter,
+    save_cached_readme,
+    save_http_cache_entry,
 )
 
 
+def _http_response(status_code, content=b"", headers=None):
+    """Build a mock streamed requests.Response for raw README fetch tests."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.content = content
+    response.iter_content.return_value = [content]
+    response.headers = headers or {}
+    return response
+
+
+def _github_api_response(status, body, headers=None):
+    """Build a urllib3 response as returned by the connection under PyGithub's requester."""
+    import io
+    import json
+
+    from urllib3 import HTTPResponse
+
+    return HTTPResponse(
+        body=io.BytesIO(json.dumps(body).encode('utf-8')),
+        headers={'Content-Type': 'application/json', **(headers or {})},
+        status=status,
+        reason='Forbidden' if status == 403 else 'OK',
+        preload_content=False,
+        request_method='GET',
+    )
+
+
+def _readme_request(client):
+    """Return a fetch operation that requests a README through the client's requester."""
+    return lambda repo_name: client.requester.requestJsonAndCheck("GET", f"/repos/{repo_name}/readme")[1]
+
+
 class TestReadmeParser:
     """Test suite for README parser functionality."""
 
@@ -140,7 +188,7 @@ class TestGitHubClient:
         client = get_github_client("")
         assert client is not None
 
-    @patch('scripts.fetch_awesome_llm_apps.Github')
+    @patch('github.Github')
     def test_get_github_client_auth_failure_fallback(self, mock_github):
         """Test that client falls back to unauthenticated on auth failure."""
         # Mock authenticated client to raise exception
@@ -196,6 +244,67 @@ class TestGitHubClient:
         assert result is None
         assert fetch_op.call_count == 2
 
+    @patch('scripts.fetch_awesome_llm_apps._api_quota_reset_at', 0.0)
+    def test_fetch_with_retry_quota_exhausted_skips_later_calls(self):
+        """Test that an exhausted hourly quota is not retried and short-circuits later calls."""
+        import time
+        from github.GithubException import RateLimitExceededException
+
+        mock_client = Mock()
+        headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time.time()) + 3600)}
+        fetch_op = Mock(side_effect=RateLimitExceededException(403, "Rate limit", headers))
+
+        with patch('scripts.fetch_awesome_llm_apps.time.sleep') as mock_sleep:
+            assert fetch_with_retry(mock_client, fetch_op, "owner/repo") is None
+            assert fetch_with_retry(mock_client, fetch_op, "owner/other") is None
+
+        assert fetch_op.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('scripts.fetch_awesome_llm_apps._api_quota_reset_at', 0.0)
+    def test_exhausted_quota_reaches_fetch_with_retry_without_sleeping(self):
+        """Test that the client's requester surfaces an exhausted quota instead of waiting for the reset."""
+        import time
+
+        client = get_github_client("")
+        response = _github_api_response(
+            403,
+            {"message": "API rate limit exceeded for 127.0.0.1."},
+            {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time.time()) + 3600)}
+        )
+
+        with patch('urllib3.connectionpool.HTTPConnectionPool._make_request', return_value=response) as mock_request, \
+                patch('time.sleep') as mock_sleep:
+            assert fetch_with_retry(client, _readme_request(client), "owner/repo") is None
+            assert fetch_with_retry(client, _readme_request(client), "owner/other") is None
+
+        assert mock_request.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_secondary_rate_limit_waits_for_retry_after(self, caplog):
+        """Test that a secondary rate limit reaches fetch_with_retry, which waits for Retry-After."""
+        client = get_github_client("")
+        responses = [
+            _github_api_response(
+                403,
+                {"message": "You have exceeded a secondary rate limit. Please wait a few minutes."},
+                {'Retry-After': '30'}
+            ),
+            _github_api_response(200, {"name": "README.md"}),
+        ]
+
+        with patch('urllib3.connectionpool.HTTPConnectionPool._make_request', side_effect=responses) as mock_request, \
+                patch('time.sleep') as mock_sleep, caplog.at_level(logging.WARNING):
+            result = fetch_with_retry(client, _readme_request(client), "owner/repo")
+
+        assert result["name"] == "README.md"
+        assert mock_request.call_count == 2
+        # Besides PyGithub's sub-second spacing between requests, the only
+        # wait is the Retry-After delay
+        mock_sleep.assert_any_call(30.0)
+        assert max(call.args[0] for call in mock_sleep.call_args_list) == 30.0
+        assert "Waiting 30.0s before retry" in caplog.text
+
     def test_fetch_with_retry_generic_exception(self):
         """Test that None is returned on generic exception."""
         mock_client = Mock()
@@ -204,51 +313,174 @@ class TestGitHubClient:
         result = fetch_with_retry(mock_client, fetch_op, "owner/repo")
         assert result is None
 
-    @patch('scripts.fetch_awesome_llm_apps.urllib.request.urlopen')
-    def test_fetch_raw_readme_success(self, mock_urlopen):
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_raw_readme_success(self, mock_session):
         """Test successful raw README fetch."""
-        mock_response = Mock()
-        mock_response.read.return_value = b"# Test README\nContent here"
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_session.return_value.get.return_value = _http_response(200, b"# Test README\nContent here")
 
         result = fetch_raw_readme("https://github.com/owner/repo")
 
         assert result == "# Test README\nContent here"
-        mock_urlopen.assert_called_once()
+        mock_session.return_value.get.assert_called_once()
 
-    @patch('scripts.fetch_awesome_llm_apps.urllib.request.urlopen')
-    def test_fetch_raw_readme_404_tries_master_branch(self, mock_urlopen):
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_raw_readme_404_tries_master_branch(self, mock_session):
         """Test that master branch is tried if main returns 404."""
         # The function tries multiple README filenames, so we need to mock all attempts
         # Main branch: 4 attempts all fail with 404
         # Master branch: first attempt (README.md) succeeds
-        mock_response_main = Mock()
-        mock_response_main.read.return_value = b"Master content"
-
-        mock_urlopen.side_effect = [
+        mock_session.return_value.get.side_effect = [
             # Main branch attempts - all 404s
-            urllib.error.HTTPError("url", 404, "Not Found", {}, None),
-            urllib.error.HTTPError("url", 404, "Not Found", {}, None),
-            urllib.error.HTTPError("url", 404, "Not Found", {}, None),
-            urllib.error.HTTPError("url", 404, "Not Found", {}, None),
+            _http_response(404),
+            _http_response(404),
+            _http_response(404),
+            _http_response(404),
             # Master branch - success on first attempt
-            MagicMock(__enter__=Mock(return_value=mock_response_main))
+            _http_response(200, b"Master content"),
         ]
 
-        result = fetch_raw_readme("https://github.com/owner/repo", branch="main")
+        result = fetch_raw_readme("https://github.com/owner/repo")
 
         assert result == "Master content"
-        assert mock_urlopen.call_count == 5
+        assert mock_session.return_value.get.call_count == 5
+        last_url = mock_session.return_value.get.call_args_list[-1].args[0]
+        assert last_url == "https://raw.githubusercontent.com/owner/repo/master/README.md"
+
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_raw_readme_stores_cache_entry(self, mock_session, tmp_path):
+        """Test that a fetched README is cached with its validators."""
+        mock_session.return_value.get.return_value = _http_response(
+            200,
+            b"# Cached README",
+            {'ETag': '"abc123"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+        )
+
+        result = fetch_raw_readme("https://github.com/owner/repo", cache_dir=str(tmp_path))
 
-    @patch('scripts.fetch_awesome_llm_apps.urllib.request.urlopen')
-    def test_fetch_raw_readme_url_error(self, mock_urlopen):
-        """Test that None is returned on URL error."""
-        mock_urlopen.side_effect = urllib.error.URLError("Connection failed")
+        assert result == "# Cached README"
+        entry = load_http_cache_entry(
+            str(tmp_path), "https://raw.githubusercontent.com/owner/repo/main/README.md"
+        )
+        assert entry['etag'] == '"abc123"'
+        assert entry['body'] == "# Cached README"
+
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_raw_readme_not_modified_uses_cache(self, mock_session, tmp_path):
+        """Test that a 304 response returns the cached README body."""
+        raw_url = "https://raw.githubusercontent.com/owner/repo/main/README.md"
+        save_http_cache_entry(str(tmp_path), raw_url, '"abc123"', None, "# Cached README")
+        mock_session.return_value.get.return_value = _http_response(304)
+
+        result = fetch_raw_readme("https://github.com/owner/repo", cache_dir=str(tmp_path))
+
+        assert result == "# Cached README"
+        headers = mock_session.return_value.get.call_args.kwargs['headers']
+        assert headers['If-None-Match'] == '"abc123"'
+        mock_session.return_value.get.assert_called_once()
+
+    @patch('scripts.fetch_awesome_llm_apps.MAX_README_BYTES', 10)
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_raw_readme_truncates_oversized_body(self, mock_session):
+        """Test that README bodies are capped at MAX_README_BYTES."""
+        response = _http_response(200)
+        response.iter_content.return_value = [b"0123456", b"789abcdef", b"never read"]
+        mock_session.return_value.get.return_value = response
+
+        result = fetch_raw_readme("https://github.com/owner/repo")
+
+        assert result == "0123456789"
+
+    def test_http_session_is_reused_per_thread(self):
+        """Test that a thread gets the same keep-alive session on every call."""
+        assert _get_http_session() is _get_http_session()
+
+    def test_cached_readme_round_trip(self, tmp_path):
+        """Test that a saved README is loaded back while it is fresh."""
+        save_cached_readme(str(tmp_path), "https://github.com/owner/repo", "# Cached")
+
+        assert load_cached_readme(str(tmp_path), "https://github.com/owner/repo") == "# Cached"
+        assert load_cached_readme(str(tmp_path), "https://github.com/owner/other") is None
+
+    def test_cached_readme_expires(self, tmp_path):
+        """Test that an expired README is not returned."""
+        with patch('scripts.fetch_awesome_llm_apps.time.time', return_value=1000.0):
+            save_cached_readme(str(tmp_path), "https://github.com/owner/repo", "# Cached")
+
+        with patch('scripts.fetch_awesome_llm_apps.time.time', return_value=1000.0 + 61):
+            assert load_cached_readme(str(tmp_path), "https://github.com/owner/repo", max_age=60) is None
+
+    def test_parse_github_url_variants(self):
+        """Test owner/repo extraction for HTTPS, .git, trailing slash and SSH URLs."""
+        assert parse_github_url('https://github.com/owner/repo') == ('owner', 'repo')
+        assert parse_github_url('https://github.com/owner/repo.git/') == ('owner', 'repo')
+        assert parse_github_url('git@github.com:owner/repo.git') == ('owner', 'repo')
+        assert parse_github_url('https://github.com/owner/repo/tree/main') is None
+        assert parse_github_url('https://example.com/owner/repo') is None
+
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_raw_readme_url_error(self, mock_session):
+        """Test that None is returned on connection error."""
+        mock_session.return_value.get.side_effect = requests.ConnectionError("Connection failed")
 
         result = fetch_raw_readme("https://github.com/owner/repo")
 
         assert result is None
 
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_readmes_graphql_batches_and_maps_urls(self, mock_session):
+        """Test that READMEs are fetched in batches and keyed by repository URL."""
+        responses = [
+            {"data": {"r0": {"readme": {"text": "# Repo A"}}, "r1": {"readme": None}}},
+            {"data": {"r0": None}, "errors": [{"message": "Could not resolve"}]},
+        ]
+        mock_post = mock_session.return_value.post
+        mock_post.return_value.json.side_effect = responses
+
+        urls = [
+            "https://github.com/owner/repo-a",
+            "https://github.com/owner/repo-b",
+            "https://github.com/owner/repo-c",
+            "https://invalid.com/repo",
+        ]
+        result = fetch_readmes_graphql("token", urls, batch_size=2)
+
+        assert result == {"https://github.com/owner/repo-a": "# Repo A"}
+        assert mock_post.call_count == 2
+        kwargs = mock_post.call_args_list[0].kwargs
+        assert kwargs['headers']['Authorization'] == 'bearer token'
+        assert 'repository(owner: "owner", name: "repo-a")' in kwargs['json']['query']
+
+    @patch('scripts.fetch_awesome_llm_apps.MAX_README_BYTES', 10)
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_readmes_graphql_truncates_oversized_text(self, mock_session):
+        """Test that GraphQL README text is capped at MAX_README_BYTES."""
+        mock_session.return_value.post.return_value.json.return_value = {
+            "data": {"r0": {"readme": {"text": "0123456789abcdef"}}}
+        }
+
+        result = fetch_readmes_graphql("token", ["https://github.com/owner/repo"])
+
+        assert result == {"https://github.com/owner/repo": "0123456789"}
+
+    @patch('scripts.fetch_awesome_llm_apps.MAX_PYTHON_FILE_BYTES', 10)
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_python_file_skips_oversized_file(self, mock_session):
+        """Test that Python files over MAX_PYTHON_FILE_BYTES are not returned."""
+        response = _http_response(200)
+        response.iter_content.return_value = [b"x = 1\n", b"y = 2\n", b"never read"]
+        mock_session.return_value.get.return_value = response
+
+        assert _fetch_python_file("https://raw.githubusercontent.com/o/r/HEAD/main.py") is None
+        response.iter_content.assert_called_once()
+
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_fetch_readmes_graphql_requires_token(self, mock_session):
+        """Test that GraphQL is not used without a token."""
+        result = fetch_readmes_graphql("", ["https://github.com/owner/repo"])
+
+        assert result == {}
+        mock_session.assert_not_called()
+
     @patch('scripts.fetch_awesome_llm_apps.fetch_raw_readme')
     @patch('scripts.fetch_awesome_llm_apps.fetch_with_retry')
     def test_fetch_project_readme_api_success(self, mock_retry, mock_raw, caplog):
@@ -282,7 +514,44 @@ class TestGitHubClient:
 
         assert result == "# Raw README"
         mock_retry.assert_called_once()
-        mock_raw.assert_called_once_with(project.url)
+        mock_raw.assert_called_once_with(project.url, cache_dir=None, dry_run=False)
+
+    @patch('scripts.fetch_awesome_llm_apps.fetch_raw_readme')
+    def test_fetch_project_readme_missing_readme_skips_raw_probe(self, mock_raw):
+        """Test that a README 404 from the API does not trigger raw URL probes."""
+        from github.GithubException import UnknownObjectException
+
+        mock_client = Mock()
+        mock_client.requester.requestJsonAndCheck.side_effect = UnknownObjectException(404, {}, {})
+        project = Project(title="TestProject", url="https://github.com/owner/repo", description="Test", category="Test")
+
+        result = fetch_project_readme(mock_client, project)
+
+        assert result is None
+        mock_client.requester.requestJsonAndCheck.assert_called_once_with(
+            "GET", "/repos/owner/repo/readme", headers=None
+        )
+        mock_raw.assert_not_called()
+
+    @patch('scripts.fetch_awesome_llm_apps.fetch_raw_readme')
+    def test_fetch_project_readme_api_revalidates_with_etag(self, mock_raw, tmp_path):
+        """Test that a cached API README is revalidated and reused on 304."""
+        import base64
+
+        mock_client = Mock()
+        project = Project(title="TestProject", url="https://github.com/owner/repo", description="Test", category="Test")
+        encoded = base64.b64encode(b"# API README").decode('ascii')
+        mock_client.requester.requestJsonAndCheck.side_effect = [
+            ({'ETag': '"v1"'}, {'encoding': 'base64', 'content': encoded}),
+            ({'ETag': '"v1"'}, None),
+        ]
+
+        assert fetch_project_readme(mock_client, project, cache_dir=str(tmp_path)) == "# API README"
+        assert fetch_project_readme(mock_client, project, cache_dir=str(tmp_path)) == "# API README"
+
+        second_call = mock_client.requester.requestJsonAndCheck.call_args_list[1]
+        assert second_call.kwargs['headers'] == {'If-None-Match': '"v1"'}
+        mock_raw.assert_not_called()
 
     @patch('scripts.fetch_awesome_llm_apps.fetch_raw_readme')
     @patch('scripts.fetch_awesome_llm_apps.fetch_with_retry')
@@ -475,6 +744,250 @@ class MainClass:
         assert result is not None
         assert result['description'] == 'The main class description.'
 
+    def test_extract_metadata_function_sharing_method_name(self, tmp_path):
+        """Test that a top-level function is kept when a method has the same name."""
+        python_code = '''
+class Runner:
+    def run(self):
+        pass
+
+def run():
+    """Module-level run."""
+    pass
+'''
+        python_file = tmp_path / "shared_name.py"
+        python_file.write_text(python_code)
+
+        result = extract_python_metadata(str(python_file))
+
+        assert result is not None
+        assert [func['name'] for func in result['functions']] == ['run']
+        assert result['classes'][0]['methods'][0]['name'] == 'run'
+
+    def test_extract_metadata_from_source_matches_file(self, tmp_path):
+        """Test that in-memory parsing gives the same metadata as parsing a file."""
+        source = '"""Module doc."""\n\nclass Agent:\n    def run(self, task):\n        pass\n'
+        py_file = tmp_path / "agent.py"
+        py_file.write_text(source)
+
+        from_source = extract_python_metadata_from_source(source, str(py_file))
+
+        assert from_source == extract_python_metadata(str(py_file))
+        assert extract_python_metadata_from_source("def broken(:\n") is None
+
+    def test_extract_metadata_uses_cache_until_file_changes(self, tmp_path):
+        """Test that cached metadata is reused only while the file is unchanged."""
+        import os
+
+        py_file = tmp_path / "cached.py"
+        py_file.write_text('"""First version."""\n')
+        cache_dir = str(tmp_path / "cache")
+
+        first = extract_python_metadata(str(py_file), cache_dir=cache_dir)
+        with patch('scripts.fetch_awesome_llm_apps.ast.parse') as mock_parse:
+            second = extract_python_metadata(str(py_file), cache_dir=cache_dir)
+        mock_parse.assert_not_called()
+        assert second == first
+
+        py_file.write_text('"""Second, longer version."""\n')
+        os.utime(py_file, ns=(0, 0))
+        third = extract_python_metadata(str(py_file), cache_dir=cache_dir)
+        assert third['description'] == "Second, longer version."
+
+    def test_extract_metadata_batch_preserves_order(self, tmp_path):
+        """Test that batch extraction returns results in input order."""
+        good_file = tmp_path / "good.py"
+        good_file.write_text('"""Good module."""\n\ndef run():\n    pass\n')
+        bad_file = tmp_path / "bad.py"
+        bad_file.write_text('def broken(\n')
+
+        paths = [str(good_file), str(bad_file), str(good_file)]
+        result = extract_python_metadata_batch(paths, max_workers=2)
+
+        assert len(result) == 3
+        assert result[0]['description'] == 'Good module.'
+        assert result[1] is None
+        assert result[2] == result[0]
+
+
+class TestMarkdownConversion:
+    """Test suite for markdown to HTML conversion."""
+
+    def test_repeated_conversions_match_markdown2(self):
+        """Test that reusing a converter gives the same HTML as a fresh one."""
+        import markdown2
+
+        extras = ['tables', 'fenced-code-blocks', 'code-friendly', 'header-ids']
+        documents = ["# Intro\n\n# Intro\n", "# Intro\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"]
+
+        for document in documents * 2:
+            assert convert_markdown_to_html(document) == markdown2.markdown(document, extras=extras)
+
+    def test_empty_content_raises(self):
+        """Test that empty markdown content is rejected."""
+        with pytest.raises(ValueError):
+            convert_markdown_to_html("")
+
+
+class TestFrontmatterRendering:
+    """Test suite for YAML frontmatter rendering."""
+
+    def test_render_matches_python_frontmatter(self):
+        """Test that rendered documents match frontmatter.dumps output."""
+        import frontmatter
+
+        metadata = {
+            'title': 'Agent: Ünïcode',
+            'description': "It's a #1 tool - really",
+            'category': 'AI Agents',
+            'url': 'https://github.com/user/repo',
+        }
+        for content in ["# Intro\n\nBody text.\n", ""]:
+            expected = frontmatter.dumps(frontmatter.Post(content, **metadata))
+            assert render_frontmatter(metadata, content) == expected
+
+    def test_render_plain_metadata_matches_yaml(self):
+        """Test that simple string metadata renders exactly as PyYAML would."""
+        import yaml
+
+        metadata = {
+            'title': 'Autonomous Game Playing Agent',
+            'url': 'https://github.com/user/repo',
+            'category': 'AI Agents',
+            'description': 'Plays games using LLM reasoning, tools and planning',
+        }
+        expected_yaml = yaml.safe_dump(metadata, default_flow_style=False).strip()
+
+        assert render_frontmatter(metadata, "Body") == f"---\n{expected_yaml}\n---\n\nBody"
+
+
+class TestProjectOutput:
+    """Test suite for per-project output generation."""
+
+    def test_generate_project_output_writes_file(self, tmp_path):
+        """Test that the project file is written under its category directory."""
+        project = Project(title="My Agent", url="https://github.com/owner/repo", category="AI Agents")
+
+        generate_project_output(project, str(tmp_path), "# My Agent\n")
+
+        output_file = tmp_path / "AI Agents" / "My_Agent.md"
+        assert output_file.read_text(encoding='utf-8').endswith("# My Agent")
+
+    def test_generate_project_output_dry_run_writes_nothing(self, tmp_path):
+        """Test that dry-run mode does not create any files."""
+        project = Project(title="My Agent", url="https://github.com/owner/repo", category="AI Agents")
+
+        generate_project_output(project, str(tmp_path), "# My Agent\n", dry_run=True)
+
+        assert list(tmp_path.iterdir()) == []
+
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    @patch('scripts.fetch_awesome_llm_apps.fetch_project_readme', return_value=None)
+    def test_process_project_falls_back_to_python_metadata(self, mock_readme, mock_session, tmp_path):
+        """Test that Tier 3 builds the page from the first Python entry point found."""
+        base = "https://raw.githubusercontent.com/owner/trip-agent/main/"
+        files = {
+            base + "main.py": b'"""Agent that plans trips."""\n\ndef main():\n    """Run the agent."""\n',
+            base + "app.py": b'"""Web frontend."""\n',
+        }
+        mock_session.return_value.get.side_effect = (
+            lambda url, **kwargs: _http_response(200, files[url]) if url in files else _http_response(404)
+        )
+        project = Project(title="Trip Agent", url="https://github.com/owner/trip-agent", category="AI Agents")
+
+        assert process_project(project, Mock(), str(tmp_path)) is True
+
+        # Candidates after the winner may or may not have been requested yet
+        requested = {call.args[0] for call in mock_session.return_value.get.call_args_list}
+        assert {base + "trip-agent.py", base + "main.py"} <= requested
+        page = (tmp_path / "AI Agents" / "Trip_Agent.md").read_text(encoding='utf-8')
+        assert "Agent that plans trips." in page
+        assert "- **main**: Run the agent." in page
+        assert "Web frontend." not in page
+
+    @patch('scripts.fetch_awesome_llm_apps._api_quota_reset_at', 0.0)
+    def test_process_project_dry_run_writes_no_api_cache(self, tmp_path):
+        """Test that a dry run served by the API tier leaves the cache directory empty."""
+        import base64
+
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        github_client = Mock()
+        github_client.requester.requestJsonAndCheck.return_value = (
+            {'ETag': '"abc"'},
+            {'encoding': 'base64', 'content': base64.b64encode(b"# Readme").decode('ascii')}
+        )
+        project = Project(title="Agent", url="https://github.com/owner/repo", category="Chat")
+
+        assert process_project(project, github_client, str(tmp_path / "out"), {}, str(cache_dir), dry_run=True)
+
+        assert list(cache_dir.iterdir()) == []
+        assert not (tmp_path / "out").exists()
+
+    @patch('scripts.fetch_awesome_llm_apps._api_quota_reset_at', 0.0)
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_process_project_dry_run_writes_no_raw_cache(self, mock_session, tmp_path):
+        """Test that a dry run served by the raw URL tier leaves the cache directory empty."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        github_client = Mock()
+        github_client.requester.requestJsonAndCheck.side_effect = RuntimeError("API unavailable")
+        mock_session.return_value.get.return_value = _http_response(200, b"# Readme", {'ETag': '"abc"'})
+        project = Project(title="Agent", url="https://github.com/owner/repo", category="Chat")
+
+        assert process_project(project, github_client, str(tmp_path / "out"), {}, str(cache_dir), dry_run=True)
+
+        assert list(cache_dir.iterdir()) == []
+
+    def test_concurrent_duplicate_projects_fetch_readme_once(self, tmp_path):
+        """Test that a repository listed twice is fetched and cached once while both entries run."""
+        import threading
+
+        started = threading.Event()
+        waiting = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch(github_client, project, cache_dir=None, dry_run=False):
+            started.set()
+            release.wait(5)
+            return "# Shared README"
+
+        projects = [
+            Project(title="Agent", url="https://github.com/owner/repo", category="Chat"),
+            Project(title="Agent", url="https://github.com/owner/repo", category="RAG"),
+        ]
+        readme_cache = {}
+        cache_dir = str(tmp_path / "cache")
+
+        def debug(message, *args):
+            if message.startswith("Waiting for in-flight"):
+                waiting.set()
+
+        with patch('scripts.fetch_awesome_llm_apps.fetch_project_readme', side_effect=slow_fetch) as mock_fetch, \
+                patch('scripts.fetch_awesome_llm_apps.save_cached_readme') as mock_save, \
+                patch('scripts.fetch_awesome_llm_apps.logger') as mock_logger:
+            mock_logger.debug.side_effect = debug
+            first = threading.Thread(
+                target=process_project, args=(projects[0], Mock(), str(tmp_path), readme_cache, cache_dir)
+            )
+            first.start()
+            started.wait(5)
+            second = threading.Thread(
+                target=process_project, args=(projects[1], Mock(), str(tmp_path), readme_cache, cache_dir)
+            )
+            second.start()
+            waiting.wait(5)
+            release.set()
+            first.join(5)
+            second.join(5)
+
+        assert mock_fetch.call_count == 1
+        mock_save.assert_called_once_with(cache_dir, projects[0].url, "# Shared README")
+        assert readme_cache == {projects[0].url: "# Shared README"}
+        for category in ("Chat", "RAG"):
+            page = (tmp_path / category / "Agent.md").read_text(encoding='utf-8')
+            assert page.endswith("# Shared README")
+
 
 class TestProjectDataclass:
     """Test suite for Project dataclass."""
@@ -503,6 +1016,14 @@ class TestProjectDataclass:
         assert project.description is None
         assert project.category == ""
 
+    def test_project_has_no_instance_dict(self):
+        """Test that Project uses __slots__ instead of a per-instance __dict__."""
+        project = Project(title="Test", url="https://github.com/user/repo")
+
+        assert not hasattr(project, '__dict__')
+        with pytest.raises(AttributeError):
+            project.stars = 10
+
 
 class TestEdgeCases:
     """Test suite for edge cases and error scenarios."""
@@ -624,10 +1145,8 @@ def main():
     pass
 '''
 
-        with patch('scripts.fetch_awesome_llm_apps.urllib.request.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.read.return_value = mock_python_content.encode('utf-8')
-            mock_urlopen.return_value.__enter__.return_value = mock_response
+        with patch('scripts.fetch_awesome_llm_apps._get_http_session') as mock_session:
+            mock_session.return_value.get.return_value = _http_response(200, mock_python_content.encode('utf-8'))
 
             with caplog.at_level(logging.DEBUG):
                 result = fetch_project_readme(mock_client, project)
@@ -663,22 +1182,22 @@ def main():
         mock_retry.assert_called_once()
         mock_raw.assert_called_once()
 
-    @patch('scripts.fetch_awesome_llm_apps.urllib.request.urlopen')
-    def test_url_error_handling_in_raw_fetch(self, mock_urlopen):
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_url_error_handling_in_raw_fetch(self, mock_session):
         """Test that URL errors (e.g., DNS failures) are handled gracefully."""
         # Simulate DNS failure / URL error
-        mock_urlopen.side_effect = urllib.error.URLError("DNS lookup failed")
+        mock_session.return_value.get.side_effect = requests.ConnectionError("DNS lookup failed")
 
         result = fetch_raw_readme("https://github.com/owner/repo")
 
         # Should return None, not raise exception
         assert result is None
 
-    @patch('scripts.fetch_awesome_llm_apps.urllib.request.urlopen')
-    def test_http_error_handling_in_raw_fetch(self, mock_urlopen):
+    @patch('scripts.fetch_awesome_llm_apps._get_http_session')
+    def test_http_error_handling_in_raw_fetch(self, mock_session):
         """Test that HTTP errors (e.g., 500, 403) are handled gracefully."""
         # Simulate server error
-        mock_urlopen.side_effect = urllib.error.HTTPError("url", 500, "Internal Server Error", {}, None)
+        mock_session.return_value.get.return_value = _http_response(500)
 
         result = fetch_raw_readme("https://github.com/owner/repo")
 